@@ -7,14 +7,152 @@ Document Converter - Конвертація Word документів у PDF
 
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Any
+import io
 import logging
 import platform
 import os
 
+# Опціональні залежності: одна спроба імпорту на процес замість
+# import-машинерії у кожному виклику гарячих методів
+try:
+    import pikepdf
+except ImportError:
+    pikepdf = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import win32com.client
+    import pythoncom
+    import pywintypes
+    _WIN32_AVAILABLE = True
+except ImportError:
+    win32com = None
+    pythoncom = None
+    pywintypes = None
+    _WIN32_AVAILABLE = False
+
+
+# Параметри перекодування зображень за рівнем стиснення (1-9):
+# (якість JPEG, поріг resize у пікселях або None, optimize, progressive)
+_LEVEL_PARAMS = {
+    1: (100, None, False, False),  # Максимальна якість
+    2: (95, None, False, False),   # Дуже висока
+    3: (90, None, True, False),    # Висока
+    4: (85, None, True, False),    # Хороша
+    5: (80, 2000, True, True),     # Хороша
+    6: (75, 1600, True, True),     # Середня
+    7: (65, 1400, True, True),     # Нижче середньої
+    8: (55, 1200, True, True),     # Низька
+    9: (45, 1000, True, True),     # Дуже низька
+}
+
+# Якість JPEG для сплющених RGBA зображень (рівні 5+)
+_RGBA_JPEG_QUALITY = {5: 80, 6: 75, 7: 65, 8: 55, 9: 45}
+
+
+# Кешований екземпляр TurboJPEG (None - ще не пробували, False - недоступний)
+_turbojpeg_encoder = None
+
+
+def _get_turbojpeg():
+    """Отримати кешований TurboJPEG енкодер (libjpeg-turbo з SIMD).
+
+    Returns:
+        TurboJPEG екземпляр або None якщо бібліотека недоступна
+    """
+    global _turbojpeg_encoder
+
+    if _turbojpeg_encoder is None:
+        try:
+            from turbojpeg import TurboJPEG
+            _turbojpeg_encoder = TurboJPEG()
+        except Exception:
+            _turbojpeg_encoder = False
+
+    return _turbojpeg_encoder or None
+
+
+def _encode_jpeg_turbo(img, quality: int) -> Optional[bytes]:
+    """Кодування PIL зображення у JPEG через libjpeg-turbo.
+
+    У 2-4 рази швидше за стоковий libjpeg у PIL завдяки SIMD
+    (AVX2/NEON) реалізації DCT та Huffman.
+
+    Args:
+        img: PIL Image у режимі RGB або L
+        quality: Якість JPEG (1-100)
+
+    Returns:
+        JPEG байти або None якщо TurboJPEG недоступний
+    """
+    encoder = _get_turbojpeg()
+    if encoder is None:
+        return None
+
+    try:
+        import numpy as np
+        from turbojpeg import TJPF_RGB, TJPF_GRAY, TJSAMP_420, TJSAMP_GRAY
+
+        if img.mode == 'RGB':
+            pixel_format, subsample = TJPF_RGB, TJSAMP_420
+        else:  # 'L'
+            pixel_format, subsample = TJPF_GRAY, TJSAMP_GRAY
+
+        return encoder.encode(
+            np.asarray(img),
+            quality=quality,
+            pixel_format=pixel_format,
+            jpeg_subsample=subsample
+        )
+    except Exception:
+        return None
+
+
+def _init_com_worker():
+    """Ініціалізація COM у дочірньому процесі пулу (тільки Windows)."""
+    if pythoncom is not None:
+        pythoncom.CoInitialize()
+
+
+def _convert_one(args: Tuple[str, str, Optional[Dict[str, Any]], bool]) -> Tuple[str, bool, str]:
+    """Конвертація одного файлу в дочірньому процесі пулу.
+
+    Створює свіжий DocConverter всередині процесу, оскільки COM об'єкти
+    не можна передавати між процесами.
+
+    Args:
+        args: (шлях до файлу, шлях до PDF, налаштування стиснення,
+            ігнорувати кеш)
+
+    Returns:
+        Tuple[str, bool, str]: (ім'я файлу, успіх, повідомлення)
+    """
+    input_str, output_str, compression_settings, ignore_cache = args
+    converter = DocConverter(compression_settings, use_word_pool=False)
+    success, message = converter.convert_to_pdf(
+        Path(input_str), Path(output_str), ignore_cache=ignore_cache
+    )
+    return input_str, success, message
+
 
 class DocConverter:
     """Клас для конвертації Word документів у PDF."""
-    
+
+    # Кількість сторінок на шард при стисненні великих PDF
+    _shard_size = 50
+
+    # Мінімальний розмір файлу для шардового стиснення: мета шардів -
+    # обмежити пікову пам'ять, тож маленькі багатосторінкові PDF
+    # обробляються звичайним шляхом
+    _shard_min_bytes = 50 * 1024 * 1024  # 50 MB
+
+    # Поріг для збереження стисненого PDF у пам'яті (один запис на диск)
+    _IN_MEMORY_SAVE_LIMIT = 500 * 1024 * 1024  # 500 MB
+
     def __init__(self, compression_settings: Optional[Dict[str, Any]] = None, use_word_pool: bool = True):
         """Ініціалізація конвертера.
         
@@ -46,30 +184,67 @@ class DocConverter:
                 self._word_pool = None
         else:
             self._word_pool = None
-        
+
+        # Спільний екземпляр Word на час пакетної конвертації (див. convert_batch)
+        self._word = None
+        self._word_pythoncom = None
+
+        # Ghostscript для агресивного стиснення (рівні 7-9)
+        import shutil
+        self._gs_path = shutil.which("gswin64c") or shutil.which("gswin32c") or shutil.which("gs")
+
+    @staticmethod
+    def _is_output_fresh(input_path: Path, output_path: Path) -> bool:
+        """Чи існує вихідний PDF і чи він не старіший за вхідний файл.
+
+        Args:
+            input_path: Шлях до вхідного Word файлу
+            output_path: Шлях до вихідного PDF
+
+        Returns:
+            bool: True якщо PDF актуальний і конвертацію можна пропустити
+        """
+        try:
+            return (
+                os.path.exists(output_path)
+                and os.path.getmtime(output_path) >= os.path.getmtime(input_path)
+            )
+        except OSError:
+            return False
+
     def convert_to_pdf(
-        self, 
-        input_path: Path, 
-        output_path: Optional[Path] = None
+        self,
+        input_path: Path,
+        output_path: Optional[Path] = None,
+        compress: bool = True,
+        ignore_cache: bool = False
     ) -> Tuple[bool, str]:
         """Конвертація Word документа у PDF.
-        
+
         Args:
             input_path: Шлях до вхідного файлу (.doc або .docx)
             output_path: Шлях до вихідного PDF файлу (опціонально)
-            
+            compress: Стискати PDF після конвертації (False коли стиснення
+                виконується окремим етапом, див. convert_batch)
+            ignore_cache: Конвертувати навіть якщо вихідний PDF актуальний
+
         Returns:
             Tuple[bool, str]: (успіх, повідомлення)
         """
         try:
             # Перевірка існування файлу
-            if not input_path.exists():
+            if not os.path.exists(input_path):
                 return False, f"Файл не знайдено: {input_path}"
-            
+
             # Визначення вихідного шляху
             if output_path is None:
                 output_path = input_path.with_suffix('.pdf')
-            
+
+            # Кеш: вихідний PDF вже існує і новіший за вхідний файл -
+            # повторна конвертація незміненого документа не потрібна
+            if not ignore_cache and self._is_output_fresh(input_path, output_path):
+                return True, f"✅ Вже конвертовано (актуальний PDF): {output_path.name}"
+
             # Вибір методу конвертації залежно від розширення
             file_ext = input_path.suffix.lower()
             
@@ -81,7 +256,7 @@ class DocConverter:
                 return False, f"Непідтримуваний формат: {file_ext}"
             
             # Якщо конвертація успішна і увімкнено стиснення
-            if success and self.compression_settings.get('enable_compression', False):
+            if success and compress and self.compression_settings.get('enable_compression', False):
                 compress_success = self._compress_pdf(output_path)
                 if compress_success:
                     message += " (стиснуто)"
@@ -114,7 +289,7 @@ class DocConverter:
             convert(str(input_path), str(output_path))
             
             # Перевірка створення файлу
-            if output_path.exists():
+            if os.path.exists(output_path):
                 return True, f"✅ Успішно конвертовано: {output_path.name}"
             else:
                 return False, "PDF файл не було створено"
@@ -150,12 +325,132 @@ class DocConverter:
         """
         if not self.is_windows:
             return False, "Конвертація .doc файлів підтримується тільки на Windows"
-        
+
+        # Спільний екземпляр Word на час batch (найдешевше - без startup)
+        if self._word is not None:
+            return self._convert_doc_shared(input_path, output_path)
+
         # Використання пулу якщо доступний
         if self.use_word_pool and self._word_pool:
             return self._convert_doc_with_pool(input_path, output_path)
         else:
             return self._convert_doc_direct(input_path, output_path)
+
+    def _acquire_word(self) -> bool:
+        """Створення спільного екземпляра Word для пакетної конвертації.
+
+        Амортизує багатосекундний запуск Word на весь batch замість
+        одного запуску на файл.
+
+        Returns:
+            True якщо екземпляр створено успішно
+        """
+        if not self.is_windows or self._word is not None:
+            return self._word is not None
+
+        if not _WIN32_AVAILABLE:
+            return False
+
+        try:
+            pythoncom.CoInitialize()
+
+            word = win32com.client.DispatchEx("Word.Application")
+            word.Visible = False
+            word.DisplayAlerts = 0
+
+            try:
+                word.AutomationSecurity = 3  # msoAutomationSecurityForceDisable
+            except Exception as e:
+                self.logger.warning(f"Не вдалося відключити макроси: {e}")
+
+            self._word = word
+            self._word_pythoncom = pythoncom
+            self.logger.info("Спільний екземпляр Word створено для пакетної конвертації")
+            return True
+
+        except ImportError:
+            return False
+        except Exception as e:
+            self.logger.warning(f"Не вдалося створити спільний екземпляр Word: {e}")
+            return False
+
+    def _release_word(self) -> None:
+        """Завершення спільного екземпляра Word після пакетної конвертації."""
+        if self._word is None:
+            return
+
+        try:
+            self._word.Quit()
+        except Exception as e:
+            self.logger.warning(f"Помилка завершення Word: {e}")
+        finally:
+            self._word = None
+
+        if self._word_pythoncom is not None:
+            try:
+                self._word_pythoncom.CoUninitialize()
+            except Exception:
+                pass
+            finally:
+                self._word_pythoncom = None
+
+    def _convert_doc_shared(
+        self,
+        input_path: Path,
+        output_path: Path
+    ) -> Tuple[bool, str]:
+        """Конвертація DOC через спільний екземпляр Word (без startup/Quit).
+
+        Args:
+            input_path: Шлях до DOC файлу
+            output_path: Шлях до вихідного PDF
+
+        Returns:
+            Tuple[bool, str]: (успіх, повідомлення)
+        """
+        if not _WIN32_AVAILABLE:
+            return False, "pywin32 не встановлено або MS Word не знайдено"
+
+        doc = None
+        try:
+            # Константи для Word
+            wdFormatPDF = 17
+            wdDoNotSaveChanges = 0
+
+            try:
+                doc = self._word.Documents.Open(
+                    str(input_path.absolute()),
+                    ConfirmConversions=False,
+                    ReadOnly=True,
+                    AddToRecentFiles=False,
+                    NoEncodingDialog=True,
+                    OpenAndRepair=False
+                )
+
+                doc.SaveAs(
+                    str(output_path.absolute()),
+                    FileFormat=wdFormatPDF,
+                    EmbedTrueTypeFonts=True
+                )
+
+                return True, f"✅ Успішно конвертовано: {output_path.name}"
+
+            except pywintypes.com_error as e:
+                self.logger.error(f"Помилка конвертації {input_path.name}: {e}")
+                return False, f"Не вдалося конвертувати документ"
+
+            finally:
+                if doc is not None:
+                    try:
+                        doc.Close(SaveChanges=wdDoNotSaveChanges)
+                    except:
+                        pass
+
+        except ImportError:
+            return False, "pywin32 не встановлено або MS Word не знайдено"
+        except Exception as e:
+            self.logger.error(f"Помилка при конвертації {input_path.name}: {e}")
+            return False, f"Помилка конвертації DOC: {str(e)}"
     
     def _convert_doc_with_pool(
         self, 
@@ -171,9 +466,10 @@ class DocConverter:
         Returns:
             Tuple[bool, str]: (успіх, повідомлення)
         """
+        if not _WIN32_AVAILABLE:
+            return False, "pywin32 не встановлено або MS Word не знайдено"
+
         try:
-            import pywintypes
-            
             # Константи для Word
             wdFormatPDF = 17
             wdDoNotSaveChanges = 0
@@ -243,15 +539,14 @@ class DocConverter:
         Returns:
             Tuple[bool, str]: (успіх, повідомлення)
         """
+        if not _WIN32_AVAILABLE:
+            return False, "pywin32 не встановлено або MS Word не знайдено"
+
         word = None
         doc = None
         com_initialized = False
         
         try:
-            import win32com.client
-            import pythoncom
-            import pywintypes
-            
             # Ініціалізація COM
             pythoncom.CoInitialize()
             com_initialized = True
@@ -349,226 +644,652 @@ class DocConverter:
             if cleanup_errors:
                 self.logger.warning(f"Помилки cleanup COM для {input_path.name}: {'; '.join(cleanup_errors)}")
     
+    @staticmethod
+    def _downscale_image(img, max_size: int):
+        """Зменшення зображення до max_size по більшій стороні.
+
+        Використовує SIMD-векторизований cv2.resize з INTER_AREA якщо
+        OpenCV доступний (в рази швидше за PIL LANCZOS на великих
+        зображеннях), інакше PIL thumbnail.
+
+        Args:
+            img: PIL Image
+            max_size: Максимальний розмір більшої сторони
+
+        Returns:
+            Зменшене PIL Image
+        """
+        width, height = img.size
+        if width <= max_size and height <= max_size:
+            return img
+
+        scale = max_size / max(width, height)
+        new_width = max(1, int(width * scale))
+        new_height = max(1, int(height * scale))
+
+        try:
+            import cv2
+            import numpy as np
+
+            arr = cv2.resize(
+                np.asarray(img),
+                (new_width, new_height),
+                interpolation=cv2.INTER_AREA
+            )
+            return Image.fromarray(arr)
+        except ImportError:
+            img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+            return img
+
+    @staticmethod
+    def _is_jpeg_small_enough(obj, raw_size: int, compression_level: int) -> bool:
+        """Евристика: чи вже стиснений JPEG менший за очікуваний re-encode.
+
+        Читає /Width та /Height прямо зі словника потоку без декодування
+        зображення. Оцінює цільовий розмір JPEG як width*height*bpp/8,
+        де bpp (біт на піксель) масштабується з якістю рівня стиснення.
+
+        Args:
+            obj: pikepdf Stream об'єкт зображення
+            raw_size: Розмір сирих байтів зображення
+            compression_level: Рівень стиснення (1-9)
+
+        Returns:
+            True якщо перекодування не дасть виграшу
+        """
+        try:
+            width = int(obj.get('/Width', 0))
+            height = int(obj.get('/Height', 0))
+            if width <= 0 or height <= 0:
+                return False
+
+            # Якість JPEG для рівня (та сама шкала, що у _recompress_image)
+            quality = _LEVEL_PARAMS.get(compression_level, _LEVEL_PARAMS[6])[0]
+
+            # Емпірично: JPEG quality q дає ~q/50 біт на піксель
+            estimated_bytes = width * height * quality // 400
+
+            return raw_size <= estimated_bytes
+        except Exception:
+            return False
+
+    def _recompress_image(
+        self,
+        raw_image: bytes,
+        compression_level: int
+    ) -> Optional[Tuple[bytes, int, int, Optional[str], str, bool]]:
+        """Перекодування одного зображення для _compress_pdf.
+
+        Виконує тільки CPU-роботу (PIL decode/resize/encode) без доторку
+        до pikepdf структур, тому безпечний для виклику з пулу потоків.
+
+        Args:
+            raw_image: Сирі байти зображення
+            compression_level: Рівень стиснення (1-9)
+
+        Returns:
+            Tuple (дані, ширина, висота, colorspace, фільтр, завжди замінювати)
+            або None якщо зображення не вдалося перекодувати
+        """
+        if Image is None:
+            return None
+
+        try:
+            img = Image.open(io.BytesIO(raw_image))
+            original_width, original_height = img.size
+
+            # Конвертація CMYK/LAB в RGB
+            if img.mode in ('CMYK', 'LAB'):
+                img = img.convert('RGB')
+
+            # Для кольорових та сірих зображень
+            if img.mode in ('RGB', 'L'):
+                # Шкала якості з передобчисленої таблиці
+                quality, resize_thr, optimize, progressive = _LEVEL_PARAMS.get(
+                    compression_level, _LEVEL_PARAMS[6]
+                )
+
+                # Зменшення розміру зображення для високих рівнів
+                if resize_thr is not None and (original_width > resize_thr or original_height > resize_thr):
+                    img = self._downscale_image(img, resize_thr)
+
+                # JPEG стиснення (TurboJPEG якщо доступний, інакше PIL)
+                jpeg_bytes = _encode_jpeg_turbo(img, quality)
+                if jpeg_bytes is None:
+                    output = io.BytesIO()
+                    img.save(output, format='JPEG',
+                           quality=quality,
+                           optimize=optimize,
+                           progressive=progressive)
+                    jpeg_bytes = output.getvalue()
+
+                colorspace = '/DeviceRGB' if img.mode == 'RGB' else '/DeviceGray'
+
+                # Рівень 1-2: замінюємо тільки якщо зменшився розмір
+                # Рівень 3+: завжди замінюємо
+                return (jpeg_bytes, img.width, img.height,
+                        colorspace, '/DCTDecode', compression_level >= 3)
+
+            # Для зображень з прозорістю
+            elif img.mode == 'RGBA':
+                # Рівень 5+: конвертуємо RGBA в RGB (втрата прозорості, але більше стиснення)
+                if compression_level >= 5:
+                    # Створюємо білий фон
+                    background = Image.new('RGB', img.size, (255, 255, 255))
+                    background.paste(img, mask=img.split()[3])  # Альфа-канал як маска
+                    img = background
+
+                    quality = _RGBA_JPEG_QUALITY.get(compression_level, 80)
+                    output = io.BytesIO()
+                    img.save(output, format='JPEG', quality=quality, optimize=True)
+                    jpeg_bytes = output.getvalue()
+
+                    return (jpeg_bytes, img.width, img.height,
+                            '/DeviceRGB', '/DCTDecode', True)
+                else:
+                    # Низькі рівні: PNG з оптимізацією
+                    output = io.BytesIO()
+                    img.save(output, format='PNG', optimize=True, compress_level=9)
+                    png_bytes = output.getvalue()
+
+                    return (png_bytes, img.width, img.height,
+                            None, '/FlateDecode', False)
+
+            return None
+
+        except Exception:
+            return None
+
+    @staticmethod
+    def _get_save_settings(compression_level: int) -> Dict[str, Any]:
+        """Налаштування pikepdf.save для рівня стиснення.
+
+        Args:
+            compression_level: Рівень стиснення (1-9)
+
+        Returns:
+            Словник kwargs для pikepdf.Pdf.save
+        """
+        if compression_level == 1:
+            # Рівень 1: мінімальні зміни
+            return {
+                'compress_streams': False,  # Не стискати
+                'stream_decode_level': pikepdf.StreamDecodeLevel.none,
+                'object_stream_mode': pikepdf.ObjectStreamMode.disable,
+            }
+        elif compression_level == 2:
+            # Рівень 2: базове стиснення
+            return {
+                'compress_streams': True,
+                'stream_decode_level': pikepdf.StreamDecodeLevel.specialized,
+                'object_stream_mode': pikepdf.ObjectStreamMode.preserve,
+            }
+        elif compression_level <= 4:
+            # Рівень 3-4: помірне стиснення
+            return {
+                'compress_streams': True,
+                'stream_decode_level': pikepdf.StreamDecodeLevel.specialized,
+                'object_stream_mode': pikepdf.ObjectStreamMode.generate,
+                'normalize_content': False,
+            }
+        elif compression_level <= 6:
+            # Рівень 5-6: сильне стиснення
+            return {
+                'compress_streams': True,
+                'stream_decode_level': pikepdf.StreamDecodeLevel.generalized,
+                'object_stream_mode': pikepdf.ObjectStreamMode.generate,
+                'recompress_flate': True,
+            }
+        else:
+            # Рівень 7-9: максимальне стиснення
+            return {
+                'compress_streams': True,
+                'stream_decode_level': pikepdf.StreamDecodeLevel.generalized,
+                'object_stream_mode': pikepdf.ObjectStreamMode.generate,
+                'linearize': True,  # Лінеаризація (без normalize_content)
+                'recompress_flate': True,
+                'deterministic_id': True,
+                'min_version': '1.5',
+            }
+
+    def _compress_pdf_sharded(self, pdf_path: Path, compression_level: int) -> bool:
+        """Стиснення великого PDF по шардах сторінок (обмежена пам'ять).
+
+        Замість тримання всього документа у пам'яті розбиває його на
+        шарди по _shard_size сторінок, стискає кожен окремо (звільняючи
+        пам'ять між шардами) та зливає результат.
+
+        Args:
+            pdf_path: Шлях до PDF файлу
+            compression_level: Рівень стиснення (1-9)
+
+        Returns:
+            bool: True якщо стиснення зменшило розмір файлу
+        """
+        import gc
+
+        original_size = os.path.getsize(pdf_path)
+        temp_path = pdf_path.with_suffix('.tmp.pdf')
+        shard_paths = []
+
+        try:
+            # Розбиття на шарди (mmap: без повного читання у пам'ять)
+            try:
+                src = pikepdf.Pdf.open(pdf_path, access_mode=pikepdf.AccessMode.mmap)
+            except (TypeError, AttributeError):
+                src = pikepdf.Pdf.open(pdf_path)
+
+            with src:
+                total_pages = len(src.pages)
+                for start in range(0, total_pages, self._shard_size):
+                    dst = pikepdf.Pdf.new()
+                    dst.pages.extend(src.pages[start:start + self._shard_size])
+                    shard_path = pdf_path.with_suffix(f'.shard{len(shard_paths)}.tmp.pdf')
+                    dst.save(shard_path)
+                    dst.close()
+                    shard_paths.append(shard_path)
+
+            gc.collect()
+
+            # Стиснення кожного шарду окремо
+            for shard_path in shard_paths:
+                self._compress_pdf(shard_path)
+                gc.collect()
+
+            # Злиття: стиснуті ресурси сторінок переносяться назад у
+            # вихідний документ замість збирання Pdf.new() зі сторінок -
+            # docinfo/XMP, закладки, іменовані призначення та AcroForm
+            # каталогу лишаються недоторканими, а об'єкти сторінок не
+            # змінюють ідентичності, тож посилання на них не ламаються
+            try:
+                base = pikepdf.Pdf.open(pdf_path, access_mode=pikepdf.AccessMode.mmap)
+            except (TypeError, AttributeError):
+                base = pikepdf.Pdf.open(pdf_path)
+
+            with base:
+                page_no = 0
+                for shard_path in shard_paths:
+                    with pikepdf.Pdf.open(shard_path) as shard:
+                        for shard_page in shard.pages:
+                            if page_no >= len(base.pages):
+                                break
+                            # Стиснуті зображення живуть у /Resources;
+                            # /Contents шардове стиснення не змінює
+                            resources = shard_page.obj.get('/Resources')
+                            if resources is not None:
+                                base.pages[page_no].obj['/Resources'] = base.copy_foreign(
+                                    shard.make_indirect(resources)
+                                )
+                            page_no += 1
+                    gc.collect()
+
+                base.save(temp_path, **self._get_save_settings(compression_level))
+
+            compressed_size = os.path.getsize(temp_path)
+
+            if compressed_size < original_size:
+                os.replace(temp_path, pdf_path)
+                reduction = ((original_size - compressed_size) / original_size) * 100
+                self.logger.info(f"PDF стиснуто по шардах ({len(shard_paths)} шард(ів), рівень {compression_level}): {pdf_path.name} - зменшено на {reduction:.1f}%")
+                return True
+            else:
+                temp_path.unlink()
+                self.logger.info(f"Шардове стиснення не зменшило розмір: {pdf_path.name}")
+                return False
+
+        except Exception as e:
+            self.logger.error(f"Помилка шардового стиснення PDF: {e}")
+            if temp_path.exists():
+                temp_path.unlink()
+            return False
+        finally:
+            for shard_path in shard_paths:
+                if shard_path.exists():
+                    shard_path.unlink()
+
+    def _compress_pdf_ghostscript(self, pdf_path: Path, compression_level: int) -> bool:
+        """Стиснення PDF через Ghostscript pdfwrite (рівні 7-9).
+
+        Ghostscript виконує downsampling зображень та subsetting шрифтів,
+        що дає значно менший розмір, ніж pikepdf re-save.
+
+        Args:
+            pdf_path: Шлях до PDF файлу
+            compression_level: Рівень стиснення (7-9)
+
+        Returns:
+            bool: True якщо стиснення зменшило розмір файлу
+        """
+        import subprocess
+
+        pdf_settings = {7: '/printer', 8: '/ebook', 9: '/screen'}.get(compression_level, '/ebook')
+        temp_path = pdf_path.with_suffix('.gs.tmp.pdf')
+
+        try:
+            original_size = os.path.getsize(pdf_path)
+
+            result = subprocess.run(
+                [
+                    self._gs_path,
+                    "-sDEVICE=pdfwrite",
+                    "-dCompatibilityLevel=1.5",
+                    f"-dPDFSETTINGS={pdf_settings}",
+                    "-dNOPAUSE",
+                    "-dQUIET",
+                    "-dBATCH",
+                    f"-sOutputFile={temp_path}",
+                    str(pdf_path)
+                ],
+                capture_output=True,
+                timeout=300
+            )
+
+            if result.returncode != 0 or not temp_path.exists():
+                self.logger.warning(f"Ghostscript завершився з помилкою (код {result.returncode})")
+                return False
+
+            compressed_size = os.path.getsize(temp_path)
+
+            if 0 < compressed_size < original_size:
+                os.replace(temp_path, pdf_path)
+                reduction = ((original_size - compressed_size) / original_size) * 100
+                size_saved = (original_size - compressed_size) / 1024 / 1024  # MB
+                self.logger.info(f"PDF стиснуто Ghostscript (рівень {compression_level}, {pdf_settings}): {pdf_path.name} - зменшено на {reduction:.1f}% ({size_saved:.2f} MB)")
+                return True
+            else:
+                temp_path.unlink()
+                self.logger.info(f"Ghostscript не зменшив розмір: {pdf_path.name}")
+                return False
+
+        except Exception as e:
+            self.logger.warning(f"Помилка Ghostscript: {e}")
+            if temp_path.exists():
+                temp_path.unlink()
+            return False
+
+    def _compress_batch_ghostscript(self, pdf_paths: list, compression_level: int) -> list:
+        """Стиснення групи PDF одним запуском Ghostscript (рівні 7-9).
+
+        Запуск gs коштує сотні мілісекунд на старт інтерпретатора; один
+        процес на всю групу амортизує цей старт. Вихідний файл
+        перемикається між завданнями через setpagedevice, тому кожен
+        вхідний PDF отримує окремий результат.
+
+        Args:
+            pdf_paths: Список шляхів до PDF файлів
+            compression_level: Рівень стиснення (7-9)
+
+        Returns:
+            list: Рядкові шляхи до успішно стиснених PDF
+        """
+        import subprocess
+
+        if self._gs_path is None or not pdf_paths:
+            return []
+
+        pdf_settings = {7: '/printer', 8: '/ebook', 9: '/screen'}.get(compression_level, '/ebook')
+
+        def _ps_string(path: Path) -> str:
+            # Літерал PostScript-рядка: екранування \ та дужок
+            text = str(path).replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+            return f"({text})"
+
+        pairs = [(pdf_path, pdf_path.with_suffix('.gs.tmp.pdf')) for pdf_path in pdf_paths]
+
+        cmd = [
+            self._gs_path,
+            "-sDEVICE=pdfwrite",
+            "-dCompatibilityLevel=1.5",
+            f"-dPDFSETTINGS={pdf_settings}",
+            "-dNOPAUSE",
+            "-dQUIET",
+            "-dBATCH",
+            f"-sOutputFile={pairs[0][1]}",
+            str(pairs[0][0])
+        ]
+        for pdf_path, temp_path in pairs[1:]:
+            cmd.extend([
+                "-c", f"<< /OutputFile {_ps_string(temp_path)} >> setpagedevice",
+                "-f", str(pdf_path)
+            ])
+
+        compressed = []
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=120 * len(pairs))
+
+            if result.returncode != 0:
+                raise RuntimeError(f"Ghostscript завершився з кодом {result.returncode}")
+
+            for pdf_path, temp_path in pairs:
+                if not temp_path.exists():
+                    continue
+                original_size = os.path.getsize(pdf_path)
+                compressed_size = os.path.getsize(temp_path)
+                if 0 < compressed_size < original_size:
+                    os.replace(temp_path, pdf_path)
+                    compressed.append(str(pdf_path))
+                else:
+                    temp_path.unlink()
+            return compressed
+
+        except Exception as e:
+            self.logger.warning(f"Пакетний запуск Ghostscript не вдався: {e}. Стиснення по одному файлу")
+            for _, temp_path in pairs:
+                if temp_path.exists():
+                    try:
+                        temp_path.unlink()
+                    except OSError:
+                        pass
+            # Fallback: звичайний шлях стиснення для кожного файлу окремо
+            for pdf_path, _ in pairs:
+                if self._compress_pdf(pdf_path):
+                    compressed.append(str(pdf_path))
+            return compressed
+
     def _compress_pdf(self, pdf_path: Path) -> bool:
         """Безвтратне стиснення PDF файлу з підтримкою різних рівнів.
-        
+
         Args:
             pdf_path: Шлях до PDF файлу
-            
+
         Returns:
             bool: True якщо стиснення успішне
         """
+        # Рівні 7-9: Ghostscript робить downsampling сам - пропускаємо цикл зображень
+        compression_level = self.compression_settings.get('compression_level', 6)
+        if compression_level >= 7 and self._gs_path:
+            if self._compress_pdf_ghostscript(pdf_path, compression_level):
+                return True
+            # Ghostscript не допоміг - пробуємо стандартний шлях
+
+        if pikepdf is None or Image is None:
+            self.logger.warning("pikepdf не встановлено - стиснення недоступне")
+            return False
+
         try:
-            import pikepdf
-            from PIL import Image
-            import io
-            
             # Отримання розміру до стиснення
-            original_size = pdf_path.stat().st_size
+            original_size = os.path.getsize(pdf_path)
             
             # Рівень стиснення (1-9)
             compression_level = self.compression_settings.get('compression_level', 6)
             
-            # Відкриття PDF
-            pdf = pikepdf.Pdf.open(pdf_path, allow_overwriting_input=True)
-            
+            # Відкриття PDF через mmap: ОС підвантажує тільки фактично
+            # використані сторінки файлу замість повного читання у RAM
+            try:
+                pdf = pikepdf.Pdf.open(
+                    pdf_path,
+                    allow_overwriting_input=True,
+                    access_mode=pikepdf.AccessMode.mmap
+                )
+            except (TypeError, AttributeError):
+                # Старі версії pikepdf без access_mode
+                pdf = pikepdf.Pdf.open(pdf_path, allow_overwriting_input=True)
+
+            # Великі документи: обробка по шардах для обмеження пам'яті.
+            # Гейт по розміру файлу, а не лише по сторінках: короткий
+            # текстовий PDF на 51 сторінку нічого не виграє від шардів
+            if (original_size > self._shard_min_bytes
+                    and len(pdf.pages) > self._shard_size):
+                pdf.close()
+                return self._compress_pdf_sharded(pdf_path, compression_level)
+
             # Лічильники для статистики
             images_found = 0
             images_compressed = 0
-            
-            # === 2. Оптимізація зображень ===
+
+            # Кешовані lookup-и поза гарячим циклом
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+            _Stream = pikepdf.Stream
+
+            # === 2. Оптимізація зображень (два проходи) ===
+            # Прохід 1: збір завдань (xobjects, key, сирі байти)
+            image_jobs = []
+
             for page_num, page in enumerate(pdf.pages):
                 try:
                     if '/Resources' in page and '/XObject' in page.get('/Resources', {}):
                         xobjects = page.get('/Resources').get('/XObject')
-                        
+
                         for key in list(xobjects.keys()):
                             obj = xobjects[key]
-                            
+
                             if isinstance(obj, pikepdf.Stream) and obj.get('/Subtype') == '/Image':
                                 images_found += 1
-                                
+
                                 try:
                                     # Рівень 1: пропускаємо стиснення зображень
                                     if compression_level == 1:
                                         continue
-                                    
+
                                     current_filter = obj.get('/Filter')
                                     raw_image = obj.read_bytes()
-                                    
-                                    self.logger.debug(f"Знайдено зображення: розмір={len(raw_image)}, фільтр={current_filter}")
-                                    
+
+                                    if debug_enabled:
+                                        self.logger.debug(f"Знайдено зображення: розмір={len(raw_image)}, фільтр={current_filter}")
+
+                                    # Дрібні зображення (іконки/мініатюри): перекодування
+                                    # витрачає більше часу, ніж заощаджує
+                                    if len(raw_image) < 4096:
+                                        continue
+
+                                    # Вже стиснений JPEG, менший за очікуваний результат
+                                    # нашого перекодування - декодувати немає сенсу
+                                    if current_filter == '/DCTDecode' and self._is_jpeg_small_enough(
+                                        obj, len(raw_image), compression_level
+                                    ):
+                                        continue
+
                                     # Рівень 2: стискаємо тільки нестиснені
                                     # Рівень 3+: стискаємо все
                                     should_compress = (compression_level >= 3) or (current_filter is None or current_filter == '/FlateDecode')
-                                    
+
                                     if should_compress:
-                                        try:
-                                            img = Image.open(io.BytesIO(raw_image))
-                                            original_width, original_height = img.size
-                                            
-                                            # Конвертація CMYK/LAB в RGB
-                                            if img.mode in ('CMYK', 'LAB'):
-                                                img = img.convert('RGB')
-                                            
-                                            output = io.BytesIO()
-                                            
-                                            # Для кольорових та сірих зображень
-                                            if img.mode in ('RGB', 'L'):
-                                                # === Розширена шкала якості ===
-                                                if compression_level == 1:
-                                                    quality = 100  # Максимальна якість
-                                                    should_resize = False
-                                                elif compression_level == 2:
-                                                    quality = 95  # Дуже висока
-                                                    should_resize = False
-                                                elif compression_level == 3:
-                                                    quality = 90  # Висока
-                                                    should_resize = False
-                                                elif compression_level == 4:
-                                                    quality = 85  # Хороша
-                                                    should_resize = False
-                                                elif compression_level == 5:
-                                                    quality = 80  # Хороша
-                                                    should_resize = original_width > 2000 or original_height > 2000
-                                                elif compression_level == 6:
-                                                    quality = 75  # Середня
-                                                    should_resize = original_width > 1600 or original_height > 1600
-                                                elif compression_level == 7:
-                                                    quality = 65  # Нижче середньої
-                                                    should_resize = original_width > 1400 or original_height > 1400
-                                                elif compression_level == 8:
-                                                    quality = 55  # Низька
-                                                    should_resize = original_width > 1200 or original_height > 1200
-                                                else:  # level 9
-                                                    quality = 45  # Дуже низька
-                                                    should_resize = original_width > 1000 or original_height > 1000
-                                                
-                                                # Зменшення розміру зображення для високих рівнів
-                                                if should_resize:
-                                                    max_size = {
-                                                        5: 2000, 6: 1600, 7: 1400, 8: 1200, 9: 1000
-                                                    }.get(compression_level, 2000)
-                                                    
-                                                    img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-                                                
-                                                # JPEG стиснення
-                                                img.save(output, format='JPEG', 
-                                                       quality=quality,
-                                                       optimize=compression_level >= 3,
-                                                       progressive=compression_level >= 5)
-                                                
-                                                # Оновлення зображення в PDF
-                                                compressed_image = pikepdf.Stream(pdf, output.getvalue())
-                                                compressed_image['/Type'] = pikepdf.Name('/XObject')
-                                                compressed_image['/Subtype'] = pikepdf.Name('/Image')
-                                                compressed_image['/Filter'] = pikepdf.Name('/DCTDecode')
-                                                compressed_image['/Width'] = img.width
-                                                compressed_image['/Height'] = img.height
-                                                compressed_image['/ColorSpace'] = pikepdf.Name('/DeviceRGB') if img.mode == 'RGB' else pikepdf.Name('/DeviceGray')
-                                                compressed_image['/BitsPerComponent'] = 8
-                                                
-                                                # Рівень 1-2: замінюємо тільки якщо зменшився розмір
-                                                # Рівень 3+: завжди замінюємо
-                                                if compression_level >= 3 or len(output.getvalue()) < len(raw_image):
-                                                    xobjects[key] = compressed_image
-                                                    images_compressed += 1
-                                                    self.logger.debug(f"Зображення стиснуто: {len(raw_image)} → {len(output.getvalue())} байт")
-                                                    
-                                            # Для зображень з прозорістю
-                                            elif img.mode == 'RGBA':
-                                                # Рівень 5+: конвертуємо RGBA в RGB (втрата прозорості, але більше стиснення)
-                                                if compression_level >= 5:
-                                                    # Створюємо білий фон
-                                                    background = Image.new('RGB', img.size, (255, 255, 255))
-                                                    background.paste(img, mask=img.split()[3])  # Альфа-канал як маска
-                                                    img = background
-                                                    
-                                                    quality = 45 if compression_level == 9 else (55 if compression_level == 8 else (65 if compression_level == 7 else (75 if compression_level == 6 else 80)))
-                                                    img.save(output, format='JPEG', quality=quality, optimize=True)
-                                                    
-                                                    compressed_image = pikepdf.Stream(pdf, output.getvalue())
-                                                    compressed_image['/Type'] = pikepdf.Name('/XObject')
-                                                    compressed_image['/Subtype'] = pikepdf.Name('/Image')
-                                                    compressed_image['/Filter'] = pikepdf.Name('/DCTDecode')
-                                                    compressed_image['/Width'] = img.width
-                                                    compressed_image['/Height'] = img.height
-                                                    compressed_image['/ColorSpace'] = pikepdf.Name('/DeviceRGB')
-                                                    compressed_image['/BitsPerComponent'] = 8
-                                                    xobjects[key] = compressed_image
-                                                else:
-                                                    # Низькі рівні: PNG з оптимізацією
-                                                    img.save(output, format='PNG', optimize=True, compress_level=9)
-                                                    
-                                                    if len(output.getvalue()) < len(raw_image):
-                                                        compressed_image = pikepdf.Stream(pdf, output.getvalue())
-                                                        compressed_image['/Type'] = pikepdf.Name('/XObject')
-                                                        compressed_image['/Subtype'] = pikepdf.Name('/Image')
-                                                        compressed_image['/Filter'] = pikepdf.Name('/FlateDecode')
-                                                        compressed_image['/Width'] = img.width
-                                                        compressed_image['/Height'] = img.height
-                                                        xobjects[key] = compressed_image
-                                                    
-                                        except Exception:
-                                            pass
-                                            
+                                        image_jobs.append((xobjects, key, raw_image))
                                 except Exception:
                                     pass
                 except Exception:
                     pass
-            
-            # === 4. Збереження у тимчасовий файл ===
-            temp_path = pdf_path.with_suffix('.tmp.pdf')
-            
-            # === 5. Диференційовані налаштування збереження ===
-            if compression_level == 1:
-                # Рівень 1: мінімальні зміни
-                save_settings = {
-                    'compress_streams': False,  # Не стискати
-                    'stream_decode_level': pikepdf.StreamDecodeLevel.none,
-                    'object_stream_mode': pikepdf.ObjectStreamMode.disable,
-                }
-            elif compression_level == 2:
-                # Рівень 2: базове стиснення
-                save_settings = {
-                    'compress_streams': True,
-                    'stream_decode_level': pikepdf.StreamDecodeLevel.specialized,
-                    'object_stream_mode': pikepdf.ObjectStreamMode.preserve,
-                }
-            elif compression_level <= 4:
-                # Рівень 3-4: помірне стиснення
-                save_settings = {
-                    'compress_streams': True,
-                    'stream_decode_level': pikepdf.StreamDecodeLevel.specialized,
-                    'object_stream_mode': pikepdf.ObjectStreamMode.generate,
-                    'normalize_content': False,
-                }
-            elif compression_level <= 6:
-                # Рівень 5-6: сильне стиснення
-                save_settings = {
-                    'compress_streams': True,
-                    'stream_decode_level': pikepdf.StreamDecodeLevel.generalized,
-                    'object_stream_mode': pikepdf.ObjectStreamMode.generate,
-                    'recompress_flate': True,
-                }
+
+            # Дедуплікація за хешем вмісту: повторювані зображення
+            # (логотипи/шапки на кожній сторінці) кодуються лише раз
+            import hashlib
+
+            job_hashes = []
+            unique_raw = {}
+            for _, _, raw in image_jobs:
+                h = hashlib.blake2b(raw, digest_size=16).digest()
+                job_hashes.append(h)
+                unique_raw.setdefault(h, raw)
+
+            # Перекодування у пулі потоків (PIL звільняє GIL у кодеках)
+            encoded_by_hash = {}
+
+            if len(unique_raw) > 1:
+                from concurrent.futures import ThreadPoolExecutor
+
+                max_workers = min(os.cpu_count() or 1, len(unique_raw))
+                hashes = list(unique_raw.keys())
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    encoded = pool.map(
+                        lambda h: self._recompress_image(unique_raw[h], compression_level),
+                        hashes
+                    )
+                    encoded_by_hash = dict(zip(hashes, encoded))
             else:
-                # Рівень 7-9: максимальне стиснення
-                save_settings = {
-                    'compress_streams': True,
-                    'stream_decode_level': pikepdf.StreamDecodeLevel.generalized,
-                    'object_stream_mode': pikepdf.ObjectStreamMode.generate,
-                    'linearize': True,  # Лінеаризація (без normalize_content)
-                    'recompress_flate': True,
-                    'deterministic_id': True,
-                    'min_version': '1.5',
+                encoded_by_hash = {
+                    h: self._recompress_image(raw, compression_level)
+                    for h, raw in unique_raw.items()
                 }
-            
+
+            # Константи Name поза циклом (кожен виклик pikepdf.Name - FFI алокація)
+            name_xobject = pikepdf.Name('/XObject')
+            name_image = pikepdf.Name('/Image')
+            names_by_str = {
+                '/DCTDecode': pikepdf.Name('/DCTDecode'),
+                '/FlateDecode': pikepdf.Name('/FlateDecode'),
+                '/DeviceRGB': pikepdf.Name('/DeviceRGB'),
+                '/DeviceGray': pikepdf.Name('/DeviceGray'),
+            }
+
+            # Прохід 2: застосування результатів (pikepdf.Stream не потокобезпечний)
+            for (xobjects, key, raw_image), job_hash in zip(image_jobs, job_hashes):
+                encoded = encoded_by_hash.get(job_hash)
+                if encoded is None:
+                    continue
+
+                data, width, height, colorspace, pdf_filter, force_replace = encoded
+
+                if not force_replace and len(data) >= len(raw_image):
+                    continue
+
+                try:
+                    compressed_image = _Stream(pdf, data)
+                    compressed_image['/Type'] = name_xobject
+                    compressed_image['/Subtype'] = name_image
+                    compressed_image['/Filter'] = names_by_str[pdf_filter]
+                    compressed_image['/Width'] = width
+                    compressed_image['/Height'] = height
+                    if colorspace:
+                        compressed_image['/ColorSpace'] = names_by_str[colorspace]
+                        compressed_image['/BitsPerComponent'] = 8
+                    xobjects[key] = compressed_image
+                    images_compressed += 1
+                    if debug_enabled:
+                        self.logger.debug(f"Зображення стиснуто: {len(raw_image)} → {len(data)} байт")
+                except Exception:
+                    pass
+
+            # === 4-5. Збереження з диференційованими налаштуваннями ===
+            save_settings = self._get_save_settings(compression_level)
+            temp_path = pdf_path.with_suffix('.tmp.pdf')
+
+            # Невеликі PDF: збереження у пам'ять, один запис на диск
+            # (замість запису temp-файлу, який одразу перейменовується)
+            if original_size < self._IN_MEMORY_SAVE_LIMIT:
+                buf = io.BytesIO()
+                pdf.save(buf, **save_settings)
+                pdf.close()
+
+                compressed_size = buf.getbuffer().nbytes
+
+                if compressed_size < original_size:
+                    temp_path.write_bytes(buf.getbuffer())
+                    os.replace(temp_path, pdf_path)
+                    reduction = ((original_size - compressed_size) / original_size) * 100
+                    size_saved = (original_size - compressed_size) / 1024 / 1024  # MB
+                    self.logger.info(f"PDF стиснуто (рівень {compression_level}): {pdf_path.name} - зменшено на {reduction:.1f}% ({size_saved:.2f} MB). Зображень: знайдено {images_found}, стиснуто {images_compressed}")
+                    return True
+                else:
+                    self.logger.info(f"Стиснення не зменшило розмір: {pdf_path.name}. Зображень: знайдено {images_found}, стиснуто {images_compressed}")
+                    return False
+
+            # Великі PDF: тимчасовий файл на диску (економія пам'яті)
             pdf.save(temp_path, **save_settings)
             pdf.close()
-            
+
             # Перевірка чи стиснення дало результат
-            compressed_size = temp_path.stat().st_size
-            
+            compressed_size = os.path.getsize(temp_path)
+
             if compressed_size < original_size:
                 # Заміна оригінального файлу
                 os.replace(temp_path, pdf_path)
@@ -593,17 +1314,84 @@ class DocConverter:
                 temp_path.unlink()
             return False
     
+    def _convert_docx_batch(self, docx_files, output_for) -> list:
+        """Конвертація групи DOCX одним викликом docx2pdf.convert(folder).
+
+        docx2pdf з аргументом-директорією повторно використовує один
+        екземпляр Word для всіх файлів усередині, що прибирає
+        багатосекундний запуск Word на кожен файл. Файли копіюються
+        у тимчасову директорію, щоб не зачепити сторонні DOCX у
+        вихідних папках.
+
+        Args:
+            docx_files: Список шляхів до DOCX файлів
+            output_for: Функція Path -> Path для вихідного шляху
+
+        Returns:
+            Список кортежів (файл, вихідний шлях, успіх, повідомлення)
+        """
+        import tempfile
+        import shutil
+        from docx2pdf import convert
+
+        results = []
+
+        with tempfile.TemporaryDirectory(prefix="docx_batch_") as tmp:
+            tmp_in = Path(tmp) / "in"
+            tmp_out = Path(tmp) / "out"
+            tmp_in.mkdir()
+            tmp_out.mkdir()
+
+            # Staging з унікальними іменами (однакові імена з різних папок)
+            staged = {}
+            for i, file_path in enumerate(docx_files):
+                staged_name = f"{i:04d}_{file_path.name}"
+                shutil.copy2(file_path, tmp_in / staged_name)
+                staged[staged_name] = file_path
+
+            # Один виклик Word на всю групу
+            convert(str(tmp_in), str(tmp_out))
+
+            for staged_name, file_path in staged.items():
+                produced = tmp_out / Path(staged_name).with_suffix('.pdf').name
+                output_path = output_for(file_path)
+
+                if produced.exists():
+                    shutil.move(str(produced), str(output_path))
+                    success = True
+                    message = f"✅ Успішно конвертовано: {output_path.name}"
+
+                    if self.compression_settings.get('enable_compression', False):
+                        if self._compress_pdf(output_path):
+                            message += " (стиснуто)"
+                else:
+                    success = False
+                    message = "PDF файл не було створено"
+
+                results.append((file_path, output_path, success, message))
+
+        return results
+
     def convert_batch(
         self,
         file_paths: list[Path],
-        output_dir: Optional[Path] = None
+        output_dir: Optional[Path] = None,
+        num_workers: Optional[int] = None,
+        ignore_cache: bool = False
     ) -> dict:
         """Пакетна конвертація списку файлів.
-        
+
+        DOCX файли обробляються паралельно у пулі процесів (кожен процес
+        створює власний DocConverter та ініціалізує COM самостійно).
+        DOC файли конвертуються послідовно, оскільки Word.Application
+        має COM/потокову афінність.
+
         Args:
             file_paths: Список шляхів до файлів
             output_dir: Директорія для збереження PDF (опціонально)
-            
+            num_workers: Кількість процесів (за замовчуванням min(CPU, файли))
+            ignore_cache: Конвертувати навіть якщо вихідні PDF актуальні
+
         Returns:
             dict: Словник з результатами {
                 'total': загальна кількість,
@@ -618,31 +1406,173 @@ class DocConverter:
             'failed': 0,
             'results': []
         }
-        
-        for file_path in file_paths:
-            # Визначення вихідного шляху
+
+        def _output_for(file_path: Path) -> Path:
             if output_dir:
-                output_path = output_dir / file_path.with_suffix('.pdf').name
-            else:
-                output_path = file_path.with_suffix('.pdf')
-            
-            # Конвертація
-            success, message = self.convert_to_pdf(file_path, output_path)
-            
-            # Збереження результату
+                return output_dir / file_path.with_suffix('.pdf').name
+            return file_path.with_suffix('.pdf')
+
+        def _record(file_path: Path, output_path: Path, success: bool, message: str):
             results['results'].append({
                 'file': file_path.name,
                 'success': success,
                 'message': message,
                 'output': str(output_path) if success else None
             })
-            
-            # Підрахунок статистики
             if success:
                 results['success'] += 1
             else:
                 results['failed'] += 1
-        
+
+        # Розділення: .doc — послідовно (Word STA), решта — паралельно
+        parallel_files = [f for f in file_paths if f.suffix.lower() != '.doc']
+        serial_files = [f for f in file_paths if f.suffix.lower() == '.doc']
+
+        if num_workers is None:
+            num_workers = min(os.cpu_count() or 1, len(parallel_files) or 1)
+
+        if len(parallel_files) > 1 and num_workers > 1:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+
+            try:
+                path_by_str = {str(f): f for f in parallel_files}
+                with ProcessPoolExecutor(
+                    max_workers=num_workers,
+                    initializer=_init_com_worker
+                ) as executor:
+                    futures = {
+                        executor.submit(
+                            _convert_one,
+                            (str(f), str(_output_for(f)), self.compression_settings, ignore_cache)
+                        ): f
+                        for f in parallel_files
+                    }
+                    for future in as_completed(futures):
+                        file_path = futures[future]
+                        try:
+                            _, success, message = future.result()
+                        except Exception as e:
+                            success, message = False, f"Помилка конвертації: {e}"
+                        _record(file_path, _output_for(file_path), success, message)
+            except (OSError, ValueError) as e:
+                # Пул недоступний (наприклад, обмеження системи) - fallback на послідовний режим
+                self.logger.warning(f"Пул процесів недоступний: {e}. Послідовна конвертація")
+                serial_files = list(file_paths)
+                results['results'].clear()
+                results['success'] = 0
+                results['failed'] = 0
+        else:
+            serial_files = list(file_paths)
+
+        # Кеш: пропуск файлів, чиї PDF вже актуальні (у пулі це робить
+        # кожен процес самостійно через ignore_cache у _convert_one)
+        if not ignore_cache:
+            remaining = []
+            for file_path in serial_files:
+                output_path = _output_for(file_path)
+                if self._is_output_fresh(file_path, output_path):
+                    _record(
+                        file_path, output_path, True,
+                        f"✅ Вже конвертовано (актуальний PDF): {output_path.name}"
+                    )
+                else:
+                    remaining.append(file_path)
+            serial_files = remaining
+
+        # Пакетний виклик docx2pdf для групи DOCX (один запуск Word на групу)
+        docx_group = [f for f in serial_files if f.suffix.lower() == '.docx']
+        if len(docx_group) > 1:
+            try:
+                batch_results = self._convert_docx_batch(docx_group, _output_for)
+                for file_path, output_path, success, message in batch_results:
+                    _record(file_path, output_path, success, message)
+                serial_files = [f for f in serial_files if f.suffix.lower() != '.docx']
+            except Exception as e:
+                self.logger.warning(f"Пакетна конвертація DOCX не вдалася: {e}. Конвертація по одному файлу")
+
+        # Двостадійний конвеєр: конвертація → стиснення в окремому потоці,
+        # щоб CPU-стиснення попереднього файлу не блокувало Word-конвертацію
+        # наступного
+        import queue
+        import threading
+
+        compression_enabled = self.compression_settings.get('enable_compression', False)
+        compression_level = self.compression_settings.get('compression_level', 6)
+        compress_queue = None
+        compressor = None
+        compressed_outputs = []
+        gs_batch_outputs = None
+
+        if (compression_enabled and len(serial_files) > 1
+                and compression_level >= 7 and self._gs_path is not None):
+            # Рівні 7-9: один запуск Ghostscript на всю групу після
+            # конвертації замість окремого процесу gs на кожен файл
+            gs_batch_outputs = []
+        elif compression_enabled and len(serial_files) > 1:
+            compress_queue = queue.Queue(maxsize=4)
+
+            def _compress_consumer():
+                while True:
+                    pdf_path = compress_queue.get()
+                    if pdf_path is None:
+                        compress_queue.task_done()
+                        break
+                    try:
+                        if self._compress_pdf(pdf_path):
+                            compressed_outputs.append(str(pdf_path))
+                    except Exception as e:
+                        self.logger.error(f"Помилка стиснення у конвеєрі: {e}")
+                    finally:
+                        compress_queue.task_done()
+
+            compressor = threading.Thread(target=_compress_consumer, daemon=True)
+            compressor.start()
+
+        # Спільний екземпляр Word на весь batch (амортизація startup)
+        has_doc_files = any(f.suffix.lower() == '.doc' for f in serial_files)
+        try:
+            if has_doc_files and self.is_windows:
+                self._acquire_word()
+
+            for file_path in serial_files:
+                output_path = _output_for(file_path)
+
+                # Кеш вже перевірено вище, тому ignore_cache=True
+                if gs_batch_outputs is not None:
+                    success, message = self.convert_to_pdf(
+                        file_path, output_path, compress=False, ignore_cache=True
+                    )
+                    if success:
+                        gs_batch_outputs.append(output_path)
+                elif compress_queue is not None:
+                    success, message = self.convert_to_pdf(
+                        file_path, output_path, compress=False, ignore_cache=True
+                    )
+                    if success:
+                        compress_queue.put(output_path)
+                else:
+                    success, message = self.convert_to_pdf(file_path, output_path, ignore_cache=True)
+
+                _record(file_path, output_path, success, message)
+        finally:
+            self._release_word()
+            if compress_queue is not None:
+                compress_queue.put(None)
+                compressor.join()
+
+        # Пакетне стиснення Ghostscript після завершення всіх конвертацій
+        if gs_batch_outputs:
+            compressed_outputs.extend(
+                self._compress_batch_ghostscript(gs_batch_outputs, compression_level)
+            )
+
+        # Доповнення повідомлень після завершення конвеєра стиснення
+        if compressed_outputs:
+            compressed_set = set(compressed_outputs)
+            for entry in results['results']:
+                if entry['output'] in compressed_set:
+                    entry['message'] += " (стиснуто)"
+
         return results
 
 
@@ -5,35 +5,60 @@ File Handler - Робота з файлами та валідація
 Модуль для валідації файлів, отримання метаданих та роботи з шляхами.
 """
 
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict
+import functools
+import heapq
 import os
+import re
+import stat
 import zipfile
 import shutil
+import sys
+import threading
 import time
 
+_MB = 1024 * 1024
+
 
 class FileHandler:
     """Клас для роботи з файлами."""
-    
+
+    # Клас повністю статичний - порожні слоти забороняють випадкове
+    # створення __dict__ на екземплярах
+    __slots__ = ()
+
     SUPPORTED_EXTENSIONS = {'.doc', '.docx'}
+    # Кортеж для str.endswith: перевірка розширення без Path.suffix
+    _SUFFIX_TUPLE = ('.doc', '.docx')
+    # DOC файли починаються з сигнатури OLE2
+    _OLE_MAGIC = b'\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1'
     MAX_FILE_SIZE_MB = 100
     LARGE_FILE_THRESHOLD_MB = 50  # Поріг для попередження про великі файли
     CACHE_TTL_SECONDS = 300  # 5 хвилин
     CACHE_MAX_SIZE = 1000
     
-    # Кеш для результатів валідації з TTL
-    _validation_cache: Dict[str, Tuple[bool, str, float]] = {}
-    
+    # Кеш для результатів валідації: LRU (move_to_end/popitem) з TTL.
+    # Ключ - кортеж (інтернований шлях, mtime): без f-string алокації,
+    # а хеш інтернованого рядка обчислюється один раз. Min-heap
+    # (час закінчення, ключ) дозволяє видаляти застарілі записи
+    # за O(log N) замість повного сканування кешу
+    _validation_cache: "OrderedDict[Tuple[str, float], Tuple[bool, str, float]]" = OrderedDict()
+    _expiry_heap: List[Tuple[float, Tuple[str, float]]] = []
+    # Лок для когерентності кешу при валідації з кількох потоків
+    _cache_lock = threading.Lock()
+
     @classmethod
     def clear_cache(cls) -> int:
         """Очистити кеш валідації.
-        
+
         Returns:
             Кількість видалених записів
         """
         count = len(cls._validation_cache)
         cls._validation_cache.clear()
+        cls._expiry_heap.clear()
         return count
     
     @classmethod
@@ -118,7 +143,9 @@ class FileHandler:
         Returns:
             True, якщо файл має підтримуване розширення
         """
-        return file_path.suffix.lower() in FileHandler.SUPPORTED_EXTENSIONS
+        # endswith по сирому рядку: без обчислення Path.suffix та
+        # хешування множини на кожен виклик
+        return os.fspath(file_path).lower().endswith(FileHandler._SUFFIX_TUPLE)
     
     @staticmethod
     def is_large_file(file_path: Path) -> Tuple[bool, float]:
@@ -133,7 +160,7 @@ class FileHandler:
         try:
             size_mb = file_path.stat().st_size / (1024 * 1024)
             return size_mb > FileHandler.LARGE_FILE_THRESHOLD_MB, size_mb
-        except:
+        except OSError:
             return False, 0.0
     
     @staticmethod
@@ -148,18 +175,36 @@ class FileHandler:
             Tuple[bool, str]: (достатньо місця, повідомлення)
         """
         try:
-            # Отримання інформації про диск
-            stat = shutil.disk_usage(directory)
-            free_mb = stat.free / (1024 * 1024)
-            
-            if free_mb < required_mb:
-                return False, f"Недостатньо місця на диску: {free_mb:.1f} MB (потрібно {required_mb} MB)"
-            
-            return True, f"Вільно: {free_mb:.1f} MB"
-            
+            # Отримання інформації про диск: цілочисельне порівняння в
+            # байтах, форматування у MB лише для повідомлення
+            usage = shutil.disk_usage(directory)
+            required_bytes = int(required_mb * _MB)
+
+            if usage.free < required_bytes:
+                return False, f"Недостатньо місця на диску: {usage.free / _MB:.1f} MB (потрібно {required_mb} MB)"
+
+            return True, f"Вільно: {usage.free / _MB:.1f} MB"
+
         except Exception as e:
             return False, f"Помилка перевірки диску: {str(e)}"
     
+    @classmethod
+    def reserve_disk_space(cls, directory: Path, files: List[Path]) -> Tuple[bool, str]:
+        """Перевірка місця на диску для всього пакету одним запитом.
+
+        Один виклик shutil.disk_usage на пакет замість statvfs на кожен
+        файл: сума оцінок розмірів PDF порівнюється з вільним місцем.
+
+        Args:
+            directory: Директорія для збереження PDF
+            files: Список вхідних Word файлів
+
+        Returns:
+            Tuple[bool, str]: (достатньо місця, повідомлення)
+        """
+        required_mb = sum(cls.estimate_pdf_size(f) for f in files)
+        return cls.check_disk_space(directory, required_mb)
+
     @staticmethod
     def estimate_pdf_size(word_file: Path) -> float:
         """Оцінка розміру PDF файлу в MB.
@@ -174,7 +219,7 @@ class FileHandler:
             # PDF зазвичай трохи більший за DOCX (коефіцієнт 1.2-1.5)
             word_size_mb = word_file.stat().st_size / (1024 * 1024)
             return word_size_mb * 1.3
-        except:
+        except OSError:
             return 10  # За замовчуванням 10 MB
     
     @staticmethod
@@ -195,125 +240,233 @@ class FileHandler:
         
         # Використовуємо санітарний шлях далі
         file_path = sanitized_path
-        
+
+        # Один os.stat на файл: існування, тип, розмір, mtime та права
+        # читання виводяться з одного syscall замість окремих
+        # exists()/is_file()/stat()/os.access()
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            return False, f"Файл не існує: {file_path}"
+        except OSError as e:
+            return False, f"Помилка доступу до файлу: {e}"
+
         # Перевірка кешу (ключ: шлях + mtime)
         if use_cache:
             try:
-                mtime = file_path.stat().st_mtime
-                cache_key = f"{file_path}_{mtime}"
-                
-                if cache_key in FileHandler._validation_cache:
-                    cached_valid, cached_msg, cached_time = FileHandler._validation_cache[cache_key]
-                    # Перевірка TTL
-                    if time.time() - cached_time < FileHandler.CACHE_TTL_SECONDS:
-                        return cached_valid, cached_msg
-                    else:
-                        # Видалення застарілого запису
-                        del FileHandler._validation_cache[cache_key]
-            except:
+                cache_key = (sys.intern(os.fspath(file_path)), st.st_mtime)
+
+                with FileHandler._cache_lock:
+                    if cache_key in FileHandler._validation_cache:
+                        cached_valid, cached_msg, cached_time = FileHandler._validation_cache[cache_key]
+                        # Перевірка TTL
+                        if time.time() - cached_time < FileHandler.CACHE_TTL_SECONDS:
+                            # Оновлення LRU-порядку при влучанні
+                            FileHandler._validation_cache.move_to_end(cache_key)
+                            return cached_valid, cached_msg
+                        else:
+                            # Видалення застарілого запису
+                            del FileHandler._validation_cache[cache_key]
+            except (OSError, KeyError):
                 pass
         
-        # Перевірка існування
-        if not file_path.exists():
-            return False, f"Файл не існує: {file_path}"
-        
         # Перевірка, що це файл, а не директорія
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             return False, f"Це не файл: {file_path}"
-        
+
         # Перевірка розширення
         if not FileHandler.is_word_file(file_path):
             return False, f"Непідтримуване розширення: {file_path.suffix}"
-        
+
         # Перевірка розміру
-        size_mb = file_path.stat().st_size / (1024 * 1024)
+        size_mb = st.st_size / (1024 * 1024)
         if size_mb > FileHandler.MAX_FILE_SIZE_MB:
             return False, f"Файл занадто великий: {size_mb:.1f} MB (максимум {FileHandler.MAX_FILE_SIZE_MB} MB)"
-        
+
         # Перевірка доступу до читання
-        if not os.access(file_path, os.R_OK):
+        if not st.st_mode & stat.S_IRUSR:
             return False, f"Немає доступу до читання: {file_path}"
         
         # Перевірка цілісності файлу (тільки якщо не в кеші)
-        is_valid, error = FileHandler.check_file_integrity(file_path)
+        is_valid, error = FileHandler.check_file_integrity(file_path, st=st)
         if not is_valid:
             result = (False, error)
         else:
             result = (True, "OK")
         
-        # Збереження в кеш
+        # Збереження в кеш (ключ вже обчислено з того ж os.stat)
         if use_cache:
             try:
-                mtime = file_path.stat().st_mtime
-                cache_key = f"{file_path}_{mtime}"
-                FileHandler._validation_cache[cache_key] = (result[0], result[1], time.time())
-                
-                # Очищення застарілих та обмеження розміру кешу
-                if len(FileHandler._validation_cache) > FileHandler.CACHE_MAX_SIZE:
-                    current_time = time.time()
-                    # Видалення записів старших за TTL
-                    expired_keys = [
-                        k for k, v in FileHandler._validation_cache.items()
-                        if current_time - v[2] > FileHandler.CACHE_TTL_SECONDS
-                    ]
-                    for key in expired_keys:
-                        del FileHandler._validation_cache[key]
-                    
-                    # Якщо ще багато - видалити найстаріші
-                    if len(FileHandler._validation_cache) > FileHandler.CACHE_MAX_SIZE:
-                        oldest_keys = sorted(
-                            FileHandler._validation_cache.keys(),
-                            key=lambda k: FileHandler._validation_cache[k][2]
-                        )[:FileHandler.CACHE_MAX_SIZE // 2]
-                        for key in oldest_keys:
-                            del FileHandler._validation_cache[key]
-            except:
+                cache_key = (sys.intern(os.fspath(file_path)), st.st_mtime)
+                now = time.time()
+                with FileHandler._cache_lock:
+                    FileHandler._validation_cache[cache_key] = (result[0], result[1], now)
+                    FileHandler._validation_cache.move_to_end(cache_key)
+                    heapq.heappush(
+                        FileHandler._expiry_heap,
+                        (now + FileHandler.CACHE_TTL_SECONDS, cache_key)
+                    )
+
+                    # Видалення застарілих записів з вершини heap - O(log N)
+                    # на запис замість повного сканування кешу
+                    while (FileHandler._expiry_heap
+                           and FileHandler._expiry_heap[0][0] <= now):
+                        _, expired_key = heapq.heappop(FileHandler._expiry_heap)
+                        FileHandler._validation_cache.pop(expired_key, None)
+
+                    # Обмеження розміру: витіснення найдавніше використаних
+                    while len(FileHandler._validation_cache) > FileHandler.CACHE_MAX_SIZE:
+                        FileHandler._validation_cache.popitem(last=False)
+            except (OSError, KeyError):
                 pass
         
         return result
-    
+
+    @classmethod
+    def validate_files(
+        cls,
+        file_paths: List[Path],
+        max_workers: int = 8,
+        use_cache: bool = True
+    ) -> List[Tuple[bool, str]]:
+        """Пакетна валідація файлів у пулі потоків.
+
+        Перевірка цілісності - це читання диска та zlib-розпакування,
+        які звільняють GIL, тому потоки перекриваються майже лінійно.
+
+        Args:
+            file_paths: Список шляхів до файлів
+            max_workers: Максимальна кількість потоків
+            use_cache: Використовувати кеш валідації
+
+        Returns:
+            Список Tuple[bool, str] у порядку вхідних файлів
+        """
+        if not file_paths:
+            return []
+        if len(file_paths) == 1:
+            return [cls.validate_file(file_paths[0], use_cache=use_cache)]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(max_workers, len(file_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda path: cls.validate_file(path, use_cache=use_cache),
+                file_paths
+            ))
+
     @staticmethod
-    def check_file_integrity(file_path: Path) -> Tuple[bool, str]:
-        """Перевірка цілісності Word документа.
-        
+    def check_file_integrity(
+        file_path: Path,
+        st: Optional[os.stat_result] = None,
+        deep: bool = False
+    ) -> Tuple[bool, str]:
+        """Перевірка цілісності Word документа з кешуванням.
+
+        Результат кешується за ключем (шлях, розмір, mtime), тому повторна
+        валідація незміненого файлу не відкриває ZIP повторно.
+
         Args:
             file_path: Шлях до файлу
-            
+            st: Результат os.stat (опціонально, щоб не робити зайвий syscall)
+            deep: Розпакувати document.xml для глибокої перевірки DOCX
+
+        Returns:
+            Tuple[bool, str]: (валідний, повідомлення про помилку)
+        """
+        try:
+            if st is None:
+                st = os.stat(file_path)
+        except OSError:
+            return False, f"Файл не існує: {file_path.name}"
+
+        return FileHandler._check_integrity_cached(
+            str(file_path), st.st_size, st.st_mtime_ns, deep
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _check_integrity_cached(
+        path_str: str,
+        size: int,
+        mtime_ns: int,
+        deep: bool
+    ) -> Tuple[bool, str]:
+        """Реалізація перевірки цілісності.
+
+        Args:
+            path_str: Шлях до файлу рядком
+            size: Розмір файлу (частина ключа кешу)
+            mtime_ns: Час модифікації в нс (частина ключа кешу)
+            deep: Розпакувати document.xml для глибокої перевірки
+
         Returns:
             Tuple[bool, str]: (валідний, повідомлення про помилку)
         """
+        file_path = Path(path_str)
+
         try:
-            # DOCX - це ZIP архів
+            # DOCX - це ZIP архів. Замість побудови повного ZipFile
+            # (ZipInfo на кожен з сотень членів архіву) читаємо лише
+            # End-of-Central-Directory та скануємо сиру центральну
+            # директорію до знаходження обох обов'язкових імен
             if file_path.suffix.lower() == '.docx':
-                if not zipfile.is_zipfile(file_path):
-                    return False, f"Файл пошкоджений: {file_path.name}"
-                
-                # Перевіряємо структуру DOCX
-                with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                    # Обов'язкові файли в DOCX
-                    required_files = ['[Content_Types].xml', 'word/document.xml']
-                    zip_files = zip_ref.namelist()
-                    
-                    for required in required_files:
-                        if required not in zip_files:
-                            return False, f"Файл пошкоджений (відсутній {required}): {file_path.name}"
-                    
-                    # Перевіряємо, що можна прочитати document.xml
-                    try:
-                        zip_ref.read('word/document.xml')
-                    except Exception:
-                        return False, f"Файл пошкоджений (не можна прочитати вміст): {file_path.name}"
-            
-            # DOC - перевіряємо магічну сигнатуру
+                required = {b'[Content_Types].xml', b'word/document.xml'}
+
+                with open(path_str, 'rb') as fp:
+                    endrec = zipfile._EndRecData(fp)
+                    if endrec is None:
+                        return False, f"Файл пошкоджений: {file_path.name}"
+
+                    cd_size = endrec[zipfile._ECD_SIZE]
+                    cd_offset = endrec[zipfile._ECD_OFFSET]
+                    # Зсув на випадок даних, доданих перед архівом
+                    concat = endrec[zipfile._ECD_LOCATION] - cd_size - cd_offset
+                    fp.seek(cd_offset + concat)
+                    central_dir = fp.read(cd_size)
+
+                # Записи центральної директорії: сигнатура PK\x01\x02,
+                # 46 байтів фіксованого заголовка, далі ім'я файлу.
+                # Ранній вихід щойно обидва імені знайдено
+                pos = 0
+                cd_len = len(central_dir)
+                while required and pos + 46 <= cd_len:
+                    if central_dir[pos:pos + 4] != b'PK\x01\x02':
+                        break
+                    name_len = int.from_bytes(central_dir[pos + 28:pos + 30], 'little')
+                    extra_len = int.from_bytes(central_dir[pos + 30:pos + 32], 'little')
+                    comment_len = int.from_bytes(central_dir[pos + 32:pos + 34], 'little')
+                    required.discard(central_dir[pos + 46:pos + 46 + name_len])
+                    pos += 46 + name_len + extra_len + comment_len
+
+                if required:
+                    missing = sorted(required)[0].decode()
+                    return False, f"Файл пошкоджений (відсутній {missing}): {file_path.name}"
+
+                # Глибока перевірка: читання document.xml розпаковує
+                # найбільший член архіву, тому тільки за запитом
+                if deep:
+                    with zipfile.ZipFile(file_path, 'r') as zip_ref:
+                        try:
+                            zip_ref.read('word/document.xml')
+                        except Exception:
+                            return False, f"Файл пошкоджений (не можна прочитати вміст): {file_path.name}"
+
+            # DOC - перевіряємо магічну сигнатуру (OLE2). Сирий fd замість
+            # open(): без буфера BufferedReader та його 8 КіБ readahead
+            # заради 8 байтів заголовка
             elif file_path.suffix.lower() == '.doc':
-                with open(file_path, 'rb') as f:
-                    header = f.read(8)
-                    # DOC файли починаються з D0 CF 11 E0 A1 B1 1A E1 (OLE2)
-                    if len(header) < 8 or header[:8] != b'\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1':
-                        return False, f"Файл пошкоджений або не є DOC: {file_path.name}"
-            
+                fd = os.open(path_str, os.O_RDONLY)
+                try:
+                    header = os.read(fd, 8)
+                finally:
+                    os.close(fd)
+                if header != FileHandler._OLE_MAGIC:
+                    return False, f"Файл пошкоджений або не є DOC: {file_path.name}"
+
             return True, "OK"
-            
+
         except zipfile.BadZipFile:
             return False, f"Файл пошкоджений (невалідний ZIP): {file_path.name}"
         except PermissionError:
@@ -333,21 +486,30 @@ class FileHandler:
             Список шляхів до Word файлів
         """
         word_files = []
-        
+
         try:
-            if not directory.exists() or not directory.is_dir():
+            if not directory.is_dir():
                 return word_files
-            
-            # Рекурсивний пошук
-            if recursive:
-                for ext in FileHandler.SUPPORTED_EXTENSIONS:
-                    word_files.extend(directory.rglob(f'*{ext}'))
-            else:
-                for ext in FileHandler.SUPPORTED_EXTENSIONS:
-                    word_files.extend(directory.glob(f'*{ext}'))
-            
+
+            # Ітеративний обхід через os.scandir: один прохід для всіх
+            # розширень, тип запису береться з d_type без додаткового
+            # stat на кожен файл (на відміну від rglob)
+            stack = [os.fspath(directory)]
+            while stack:
+                current = stack.pop()
+                try:
+                    with os.scandir(current) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                if recursive:
+                                    stack.append(entry.path)
+                            elif entry.name.lower().endswith(FileHandler._SUFFIX_TUPLE):
+                                word_files.append(Path(entry.path))
+                except PermissionError:
+                    continue
+
             return sorted(word_files)
-            
+
         except Exception as e:
             print(f"Помилка пошуку файлів: {e}")
             return []
@@ -451,26 +613,31 @@ class FileHandler:
         """
         if not file_path.exists():
             return file_path
-        
+
         # Розділення на ім'я та розширення
         stem = file_path.stem
         suffix = file_path.suffix
         parent = file_path.parent
-        
-        # Пошук унікального імені
-        counter = 1
-        while True:
-            new_name = f"{stem} ({counter}){suffix}"
-            new_path = parent / new_name
-            
-            if not new_path.exists():
-                return new_path
-            
-            counter += 1
-            
-            # Захист від нескінченного циклу
-            if counter > 1000:
-                return file_path
+
+        # Один прохід os.scandir замість stat-проби на кожен лічильник:
+        # наступний номер обчислюється з наявних "stem (N)suffix" імен
+        pattern = re.compile(
+            rf"^{re.escape(stem)} \((\d+)\){re.escape(suffix)}$",
+            re.IGNORECASE
+        )
+        max_counter = 0
+        try:
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    match = pattern.match(entry.name)
+                    if match:
+                        counter = int(match.group(1))
+                        if counter > max_counter:
+                            max_counter = counter
+        except OSError:
+            return file_path
+
+        return parent / f"{stem} ({max_counter + 1}){suffix}"
 
 
 # Тестування
@@ -8,13 +8,36 @@ Word COM Pool - Пул об'єктів MS Word для ефективної ко
 import queue
 import threading
 import logging
+import time
 from typing import Optional
 from contextlib import contextmanager
 
+# Імпорт COM модулів один раз на модуль: import у _create_word_instance
+# проходив через import lock та sys.modules на кожен виклик
+try:
+    import win32com.client
+    import pythoncom
+    _COM_AVAILABLE = True
+except ImportError:
+    win32com = None
+    pythoncom = None
+    _COM_AVAILABLE = False
+
 
 class WordPool:
     """Пул COM об'єктів MS Word для повторного використання."""
-    
+
+    # Фіксований набір атрибутів: доступ через C-зміщення замість
+    # __dict__ та менший розмір екземпляра
+    __slots__ = (
+        'pool_size', 'timeout', 'logger',
+        '_pool', '_lock', '_initialized', '_closed', '_created'
+    )
+
+    # Перевіряти живість екземпляра лише після такого простою (секунди):
+    # word.Name - це синхронний COM round-trip на кожне отримання
+    _HEALTH_CHECK_IDLE_SECONDS = 60.0
+
     def __init__(self, pool_size: int = 2, timeout: float = 30.0):
         """Ініціалізація пулу.
         
@@ -29,6 +52,8 @@ class WordPool:
         self._lock = threading.Lock()
         self._initialized = False
         self._closed = False
+        # Кількість створених екземплярів (ліниве зростання до pool_size)
+        self._created = 0
         
     def _create_word_instance(self) -> tuple:
         """Створення нового екземпляра Word.
@@ -36,13 +61,13 @@ class WordPool:
         Returns:
             Tuple[word_app, pythoncom]: (Word Application, pythoncom модуль)
         """
+        if not _COM_AVAILABLE:
+            raise RuntimeError("pywin32 не встановлено - пул Word недоступний")
+
         try:
-            import win32com.client
-            import pythoncom
-            
             # Ініціалізація COM для поточного потоку
             pythoncom.CoInitialize()
-            
+
             # Створення Word
             word = win32com.client.DispatchEx("Word.Application")
             word.Visible = False
@@ -56,29 +81,21 @@ class WordPool:
             raise
     
     def initialize(self) -> None:
-        """Ініціалізація пулу з попереднім створенням екземплярів."""
+        """Позначення пулу готовим до роботи.
+
+        Екземпляри Word більше не створюються наперед: кожен процес Word
+        коштує секунди запуску та сотні МБ пам'яті, тому пул зростає
+        ліниво у get_word - лише до фактично потрібної кількості.
+        """
         if self._initialized:
             return
-        
+
         with self._lock:
             if self._initialized:
                 return
-            
-            self.logger.info(f"Ініціалізація пулу Word з {self.pool_size} екземпляр(ів)")
-            
-            # Створення початкових екземплярів
-            for i in range(self.pool_size):
-                try:
-                    instance = self._create_word_instance()
-                    self._pool.put(instance)
-                    self.logger.debug(f"Додано екземпляр {i+1}/{self.pool_size} до пулу")
-                except Exception as e:
-                    self.logger.warning(f"Не вдалося створити екземпляр {i+1}: {e}")
-                    # Продовжуємо з меншою кількістю екземплярів
-                    break
-            
+
+            self.logger.info(f"Пул Word готовий (до {self.pool_size} екземпляр(ів), створення ліниве)")
             self._initialized = True
-            self.logger.info(f"Пул Word ініціалізовано з {self._pool.qsize()} екземпляр(ів)")
     
     @contextmanager
     def get_word(self):
@@ -102,26 +119,55 @@ class WordPool:
         word_instance = None
         pythoncom_module = None
         retrieved_from_pool = False
-        
+        last_used = 0.0
+
         try:
-            # Спроба отримати з пулу
+            # Спроба отримати вільний екземпляр без очікування
             try:
-                word_instance, pythoncom_module = self._pool.get(timeout=self.timeout)
+                word_instance, pythoncom_module, last_used = self._pool.get_nowait()
                 retrieved_from_pool = True
-                self.logger.debug(f"Отримано Word з пулу (PID: {id(word_instance)}, залишилось: {self._pool.qsize()})")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Отримано Word з пулу (PID: %s, залишилось: %s)", id(word_instance), self._pool.qsize())
             except queue.Empty:
-                # Пул порожній - створюємо новий тимчасовий екземпляр
-                self.logger.warning("Пул Word порожній, створюємо тимчасовий екземпляр")
-                word_instance, pythoncom_module = self._create_word_instance()
-                retrieved_from_pool = False
-            
-            # Перевірка, що Word ще живий
-            try:
-                _ = word_instance.Name
-            except:
-                self.logger.warning("Word екземпляр не відповідає, створюємо новий")
-                word_instance, pythoncom_module = self._create_word_instance()
-                retrieved_from_pool = False
+                # Ліниве зростання пулу: новий екземпляр створюється лише
+                # коли вільних немає і ліміт ще не досягнуто
+                create_new = False
+                with self._lock:
+                    if self._created < self.pool_size:
+                        self._created += 1
+                        create_new = True
+
+                if create_new:
+                    try:
+                        word_instance, pythoncom_module = self._create_word_instance()
+                        retrieved_from_pool = True
+                        last_used = time.time()
+                        self.logger.debug(f"Пул Word зріс до {self._created}/{self.pool_size} екземпляр(ів)")
+                    except Exception:
+                        with self._lock:
+                            self._created -= 1
+                        raise
+                else:
+                    # Ліміт досягнуто - чекаємо на повернення екземпляра
+                    try:
+                        word_instance, pythoncom_module, last_used = self._pool.get(timeout=self.timeout)
+                        retrieved_from_pool = True
+                    except queue.Empty:
+                        self.logger.warning("Пул Word порожній, створюємо тимчасовий екземпляр")
+                        word_instance, pythoncom_module = self._create_word_instance()
+                        retrieved_from_pool = False
+                        last_used = time.time()
+
+            # Перевірка живості лише після тривалого простою: свіжо
+            # використаному екземпляру довіряємо без COM round-trip
+            if time.time() - last_used > self._HEALTH_CHECK_IDLE_SECONDS:
+                try:
+                    _ = word_instance.Name
+                except Exception:
+                    self.logger.warning("Word екземпляр не відповідає, створюємо новий")
+                    if retrieved_from_pool:
+                        self._destroy_instance(word_instance, pythoncom_module)
+                    word_instance, pythoncom_module = self._create_word_instance()
             
             yield word_instance
             
@@ -129,21 +175,19 @@ class WordPool:
             # Cleanup
             if word_instance is not None:
                 try:
-                    # Закриваємо всі відкриті документи
+                    # Закриваємо всі відкриті документи одним COM викликом:
+                    # ітерація по Documents - це RPC на кожен документ
                     if word_instance.Documents.Count > 0:
-                        for doc in word_instance.Documents:
-                            try:
-                                doc.Close(SaveChanges=False)
-                            except:
-                                pass
-                except:
+                        word_instance.Documents.Close(SaveChanges=0)
+                except Exception:
                     pass
                 
                 # Повертаємо в пул або знищуємо
                 if retrieved_from_pool and not self._closed:
                     try:
-                        self._pool.put_nowait((word_instance, pythoncom_module))
-                        self.logger.debug(f"Повернуто Word до пулу (PID: {id(word_instance)}, всього: {self._pool.qsize()})")
+                        self._pool.put_nowait((word_instance, pythoncom_module, time.time()))
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug("Повернуто Word до пулу (PID: %s, всього: %s)", id(word_instance), self._pool.qsize())
                     except queue.Full:
                         # Пул переповнений, знищуємо екземпляр
                         self._destroy_instance(word_instance, pythoncom_module)
@@ -160,20 +204,15 @@ class WordPool:
         """
         try:
             word_instance.Quit()
-        except:
-            pass
-        
-        try:
-            del word_instance
-        except:
-            pass
-        
+        except Exception as e:
+            self.logger.debug(f"Word.Quit не вдався: {e}")
+
         if pythoncom_module:
             try:
                 pythoncom_module.CoUninitialize()
-            except:
-                pass
-        
+            except Exception as e:
+                self.logger.debug(f"CoUninitialize не вдався: {e}")
+
         self.logger.debug("Екземпляр Word знищено")
     
     def close(self) -> None:
@@ -191,7 +230,7 @@ class WordPool:
             # Знищення всіх екземплярів з пулу
             while not self._pool.empty():
                 try:
-                    word_instance, pythoncom_module = self._pool.get_nowait()
+                    word_instance, pythoncom_module, _ = self._pool.get_nowait()
                     self._destroy_instance(word_instance, pythoncom_module)
                 except queue.Empty:
                     break
@@ -204,7 +243,7 @@ class WordPool:
         """Деструктор - гарантує закриття пулу."""
         try:
             self.close()
-        except:
+        except Exception:
             pass
     
     def get_stats(self) -> dict:
@@ -215,6 +254,7 @@ class WordPool:
         """
         return {
             'pool_size': self.pool_size,
+            'created': self._created,
             'available': self._pool.qsize(),
             'initialized': self._initialized,
             'closed': self._closed
@@ -248,9 +288,15 @@ def get_word_pool(pool_size: int = 2) -> WordPool:
 def close_global_pool() -> None:
     """Закрити глобальний пул Word."""
     global _global_word_pool
-    
+
+    # Знімаємо посилання під локом, але close() викликаємо поза ним:
+    # Word.Quit може тривати секунди і не повинен блокувати
+    # конкурентні виклики get_word_pool
+    pool = None
     if _global_word_pool is not None:
         with _pool_lock:
-            if _global_word_pool is not None:
-                _global_word_pool.close()
-                _global_word_pool = None
+            pool = _global_word_pool
+            _global_word_pool = None
+
+    if pool is not None:
+        pool.close()
@@ -0,0 +1,28 @@
+"""
+Shared Fonts - Спільний кеш шрифтів
+===================================
+
+Мемоізоване створення CTkFont: кожен CTkFont реєструє окремий Tk
+ресурс, а панелі використовують лише кілька однакових комбінацій
+(розмір, насиченість, сімейство).
+"""
+
+import functools
+from typing import Optional
+
+import customtkinter as ctk
+
+
+@functools.lru_cache(maxsize=64)
+def font(size: int, weight: str = "normal", family: Optional[str] = None) -> ctk.CTkFont:
+    """Отримати спільний CTkFont для комбінації параметрів.
+
+    Args:
+        size: Розмір шрифту
+        weight: Насиченість ("normal" або "bold")
+        family: Сімейство шрифту (опціонально)
+
+    Returns:
+        Спільний екземпляр CTkFont
+    """
+    return ctk.CTkFont(family=family, size=size, weight=weight)
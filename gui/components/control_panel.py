@@ -8,6 +8,8 @@ Control Panel - Панель керування
 import customtkinter as ctk
 from typing import Callable, Optional, Any
 
+from gui.components._fonts import font
+
 
 class ControlPanel(ctk.CTkFrame):
     """Панель з кнопками управління."""
@@ -45,36 +47,54 @@ class ControlPanel(ctk.CTkFrame):
         self.on_pause: Optional[Callable[[], None]] = on_pause  # #24
         self.theme_manager = theme_manager
         self.i18n = i18n
-        
+
+        # Тротлінг прогрес бару: конвертер може викликати set_progress
+        # значно частіше за кадр, тому значення коалесціюються
+        self._pending_progress: Optional[float] = None
+        self._progress_after = None
+        # Останні застосовані стани: повторні виклики з тим самим
+        # значенням не генерують Tk configure
+        self._last_converting: Optional[bool] = None
+        self._last_paused: Optional[bool] = None
+
         self._create_ui()
     
     def _create_ui(self):
         """Створення UI елементів."""
-        # Загальний прогрес бар (спочатку схований)
-        self.overall_progress = ctk.CTkProgressBar(
-            self,
-            mode="determinate",
-            height=20
-        )
-        self.overall_progress.grid(row=0, column=0, columnspan=4, padx=20, pady=(0, 10))
-        self.overall_progress.set(0)
-        self.overall_progress.grid_remove()
-        
+        # Кольори та написи шукаються один раз: get_color/i18n.get
+        # викликались по 2-3 рази на кожне однакове значення
+        c_info = self.theme_manager.get_color("info")
+        c_success = self.theme_manager.get_color("success")
+        c_warning = self.theme_manager.get_color("warning")
+        c_settings = self.theme_manager.get_color("settings")
+
+        # Кольори для set_converting_state, щоб не шукати при кожному
+        # перемиканні стану
+        self._c_success = c_success
+        self._c_warning = c_warning
+        self._c_info = c_info
+
+        # Прогрес бар та кнопка паузи потрібні лише під час конвертації,
+        # тому створюються ліниво при першому показі
+        self.overall_progress: Optional[ctk.CTkProgressBar] = None
+        self.btn_pause: Optional[ctk.CTkButton] = None
+
+
         # Кнопка "Вибрати папку"
         self.btn_select_folder = ctk.CTkButton(
             self,
             text=self.i18n.get("icon_folder") + " Папка",
             width=100,
             height=40,
-            font=ctk.CTkFont(size=13),
-            fg_color=self.theme_manager.get_color("info"),
+            font=font(13),
+            fg_color=c_info,
             command=self.on_select_folder
         )
         self.btn_select_folder.grid(row=1, column=0, padx=5, pady=10)
         self.theme_manager.apply_hover_effect(
             self.btn_select_folder,
-            enter_color=self.theme_manager.get_color("info"),
-            leave_color=self.theme_manager.get_color("info")
+            enter_color=c_info,
+            leave_color=c_info
         )
         
         # Кнопка "Конвертувати"
@@ -85,33 +105,14 @@ class ControlPanel(ctk.CTkFrame):
             width=200,
             height=50,
             corner_radius=15,
-            font=ctk.CTkFont(size=16, weight="bold"),
-            fg_color=self.theme_manager.get_color("success")
+            font=font(16, "bold"),
+            fg_color=c_success
         )
         self.btn_convert.grid(row=1, column=1, padx=10, pady=10)
         self.theme_manager.apply_hover_effect(
             self.btn_convert,
-            enter_color=self.theme_manager.get_color("success"),
-            leave_color=self.theme_manager.get_color("success")
-        )
-        
-        # #24 Кнопка "Пауза" (спочатку схована)
-        self.btn_pause = ctk.CTkButton(
-            self,
-            text="⏸️",
-            command=self.on_pause if self.on_pause else lambda: None,
-            width=60,
-            height=50,
-            corner_radius=15,
-            font=ctk.CTkFont(size=18),
-            fg_color=self.theme_manager.get_color("info")
-        )
-        self.btn_pause.grid(row=1, column=2, padx=5, pady=10)
-        self.btn_pause.grid_remove()  # Спочатку схована
-        self.theme_manager.apply_hover_effect(
-            self.btn_pause,
-            enter_color=self.theme_manager.get_color("info"),
-            leave_color=self.theme_manager.get_color("info")
+            enter_color=c_success,
+            leave_color=c_success
         )
         
         # Кнопка "Очистити"
@@ -122,14 +123,14 @@ class ControlPanel(ctk.CTkFrame):
             width=150,
             height=50,
             corner_radius=15,
-            font=ctk.CTkFont(size=14),
-            fg_color=self.theme_manager.get_color("warning")
+            font=font(14),
+            fg_color=c_warning
         )
         self.btn_clear.grid(row=1, column=3, padx=10, pady=10)
         self.theme_manager.apply_hover_effect(
             self.btn_clear,
-            enter_color=self.theme_manager.get_color("warning"),
-            leave_color=self.theme_manager.get_color("warning")
+            enter_color=c_warning,
+            leave_color=c_warning
         )
         
         # Кнопка "Налаштування"
@@ -139,14 +140,14 @@ class ControlPanel(ctk.CTkFrame):
             command=self.on_settings,
             width=40,
             height=40,
-            font=ctk.CTkFont(size=18),
-            fg_color=self.theme_manager.get_color("settings")
+            font=font(18),
+            fg_color=c_settings
         )
         self.btn_settings.grid(row=1, column=4, padx=5, pady=10)
         self.theme_manager.apply_hover_effect(
             self.btn_settings,
-            enter_color=self.theme_manager.get_color("settings"),
-            leave_color=self.theme_manager.get_color("settings")
+            enter_color=c_settings,
+            leave_color=c_settings
         )
         
         # Центрування кнопок
@@ -156,31 +157,67 @@ class ControlPanel(ctk.CTkFrame):
         self.grid_columnconfigure(3, weight=0)
         self.grid_columnconfigure(4, weight=0)
     
+    def _ensure_progress_bar(self):
+        """Створити загальний прогрес бар при першому використанні."""
+        if self.overall_progress is None:
+            self.overall_progress = ctk.CTkProgressBar(
+                self,
+                mode="determinate",
+                height=20
+            )
+            self.overall_progress.grid(row=0, column=0, columnspan=4, padx=20, pady=(0, 10))
+
+    def _ensure_pause_button(self):
+        """#24 Створити кнопку паузи при першому використанні."""
+        if self.btn_pause is None:
+            self.btn_pause = ctk.CTkButton(
+                self,
+                text="⏸️",
+                command=self.on_pause if self.on_pause else lambda: None,
+                width=60,
+                height=50,
+                corner_radius=15,
+                font=font(18),
+                fg_color=self._c_info
+            )
+            self.btn_pause.grid(row=1, column=2, padx=5, pady=10)
+            self.theme_manager.apply_hover_effect(
+                self.btn_pause,
+                enter_color=self._c_info,
+                leave_color=self._c_info
+            )
+
     def set_converting_state(self, is_converting: bool):
         """Встановити стан конвертації.
         
         Args:
             is_converting: True якщо йде конвертація
         """
+        if is_converting == self._last_converting:
+            return
+        self._last_converting = is_converting
+
         if is_converting:
             self.btn_convert.configure(
                 text=self.i18n.get("btn_stop"),
-                fg_color=self.theme_manager.get_color("warning")
+                fg_color=self._c_warning
             )
             self.btn_clear.configure(state="disabled")
             self.btn_select_folder.configure(state="disabled")
             # #24 Показати кнопку паузи
             if self.on_pause:
+                self._ensure_pause_button()
                 self.btn_pause.grid()
         else:
             self.btn_convert.configure(
                 text=self.i18n.get("btn_convert"),
-                fg_color=self.theme_manager.get_color("success")
+                fg_color=self._c_success
             )
             self.btn_clear.configure(state="normal")
             self.btn_select_folder.configure(state="normal")
             # #24 Сховати кнопку паузи
-            self.btn_pause.grid_remove()
+            if self.btn_pause is not None:
+                self.btn_pause.grid_remove()
     
     def set_pause_state(self, is_paused: bool):
         """#24 Встановити стан паузи.
@@ -188,6 +225,12 @@ class ControlPanel(ctk.CTkFrame):
         Args:
             is_paused: True якщо конвертація на паузі
         """
+        if is_paused == self._last_paused:
+            return
+        self._last_paused = is_paused
+
+        if self.btn_pause is None:
+            return
         if is_paused:
             self.btn_pause.configure(text="▶️")  # Іконка відновлення
         else:
@@ -195,20 +238,34 @@ class ControlPanel(ctk.CTkFrame):
     
     def show_progress_bar(self):
         """Показати загальний прогрес бар."""
+        self._ensure_progress_bar()
         self.overall_progress.grid()
         self.overall_progress.set(0)
-    
+
     def hide_progress_bar(self):
         """Сховати загальний прогрес бар."""
-        self.overall_progress.grid_remove()
+        if self.overall_progress is not None:
+            self.overall_progress.grid_remove()
     
     def set_progress(self, value: float):
         """Встановити значення прогресу.
-        
+
+        Виклики коалесціюються: N оновлень між кадрами зводяться до
+        одного Tk set (~30 Гц), щоб конвертер не заповнював чергу подій.
+
         Args:
             value: Значення від 0.0 до 1.0
         """
-        self.overall_progress.set(value)
+        self._pending_progress = value
+        if self._progress_after is None:
+            self._progress_after = self.after(33, self._flush_progress)
+
+    def _flush_progress(self):
+        """Застосувати останнє накопичене значення прогресу."""
+        self._progress_after = None
+        if self._pending_progress is not None and self.overall_progress is not None:
+            self.overall_progress.set(self._pending_progress)
+        self._pending_progress = None
     
     def set_convert_command(self, command: Callable):
         """Змінити команду кнопки конвертації.
@@ -11,6 +11,11 @@ from tkinterdnd2 import DND_FILES
 from typing import Callable, Optional
 import re
 
+from gui.components._fonts import font
+
+# Шаблон шляхів TkDND: компілюється один раз на модуль, а не на drop
+_DND_PATH_RE = re.compile(r'\{([^}]+)\}|(\S+)')
+
 
 class DropZonePanel(ctk.CTkFrame):
     """Панель для drag & drop файлів."""
@@ -39,7 +44,17 @@ class DropZonePanel(ctk.CTkFrame):
         self.on_click = on_click
         self.theme_manager = theme_manager
         self.i18n = i18n
-        
+
+        # Кольори рамки та іконки для drag-подій: обчислюються один
+        # раз, щоб enter/leave/drop не ходили у тему та i18n щоразу
+        self._border_normal = theme_manager.get_color("drop_zone_border")
+        self._border_hover = theme_manager.get_color("accent_hover")
+        self._icon_clip = i18n.get("icon_clip")
+        self._icon_download = i18n.get("icon_download")
+        # Деякі backend-и tkinterdnd2 шлють DragEnter повторно під час
+        # руху курсора; стан підсвітки не перемальовується без зміни
+        self._drag_active = False
+
         self._create_ui()
         self._setup_drag_and_drop()
     
@@ -50,7 +65,7 @@ class DropZonePanel(ctk.CTkFrame):
             self,
             corner_radius=15,
             border_width=3,
-            border_color=self.theme_manager.get_color("drop_zone_border"),
+            border_color=self._border_normal,
             fg_color=self.theme_manager.get_color("drop_zone_bg")
         )
         self.drop_area.grid(row=0, column=0, sticky="nsew", padx=20, pady=10)
@@ -72,8 +87,8 @@ class DropZonePanel(ctk.CTkFrame):
         # Іконка
         self.drop_icon_label = ctk.CTkLabel(
             drop_content,
-            text=self.i18n.get("icon_clip"),
-            font=ctk.CTkFont(size=48),
+            text=self._icon_clip,
+            font=font(48),
             cursor="hand2"
         )
         self.drop_icon_label.pack(pady=(20, 10))
@@ -83,7 +98,7 @@ class DropZonePanel(ctk.CTkFrame):
         drop_text_main = ctk.CTkLabel(
             drop_content,
             text=self.i18n.get("drop_zone_title"),
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=font(16, "bold"),
             cursor="hand2"
         )
         drop_text_main.pack(pady=(0, 5))
@@ -93,7 +108,7 @@ class DropZonePanel(ctk.CTkFrame):
         drop_text_help = ctk.CTkLabel(
             drop_content,
             text=self.i18n.get("drop_zone_subtitle"),
-            font=ctk.CTkFont(size=12),
+            font=font(12),
             text_color=self.theme_manager.get_color("text_secondary"),
             cursor="hand2"
         )
@@ -104,7 +119,7 @@ class DropZonePanel(ctk.CTkFrame):
         formats_label = ctk.CTkLabel(
             drop_content,
             text=self.i18n.get("drop_zone_formats"),
-            font=ctk.CTkFont(size=10),
+            font=font(10),
             text_color=self.theme_manager.get_color("text_secondary"),
             cursor="hand2"
         )
@@ -121,31 +136,39 @@ class DropZonePanel(ctk.CTkFrame):
     def _on_drop(self, event):
         """Обробник події drop."""
         files_str = event.data
-        
-        # Парсинг шляхів
-        pattern = r'\{([^}]+)\}|(\S+)'
-        matches = re.findall(pattern, files_str)
-        files = [match[0] if match[0] else match[1] for match in matches]
-        
-        # Конвертація у Path об'єкти
-        paths = []
-        for f in files:
-            clean_path = f.strip().strip('{}').strip('"').strip("'")
-            paths.append(Path(clean_path).resolve())
-        
+
+        # Парсинг та конвертація одним проходом: група 1 шаблону вже
+        # без фігурних дужок, тому знімаються лише лапки - обидва види
+        # одним strip, без проміжного рядка на кожен шлях. translate
+        # тут не годиться: він прибрав би апострофи й усередині імен.
+        # resolve() не викликається: це syscall на кожен файл у
+        # Tk-потоці, розв'язання шляхів робить споживач списку
+        paths = [
+            Path((m[1] or m[2]).strip('"\''))
+            for m in _DND_PATH_RE.finditer(files_str)
+        ]
+
+
         # Виклик callback
         self.on_files_dropped(paths)
         
         # Повернення до нормального вигляду
-        self.drop_area.configure(border_color=self.theme_manager.get_color("drop_zone_border"))
-        self.drop_icon_label.configure(text=self.i18n.get("icon_clip"))
-    
+        self._drag_active = False
+        self.drop_area.configure(border_color=self._border_normal)
+        self.drop_icon_label.configure(text=self._icon_clip)
+
     def _on_drag_enter(self, event):
         """Обробник наведення файлів."""
-        self.drop_area.configure(border_color=self.theme_manager.get_color("accent_hover"))
-        self.drop_icon_label.configure(text=self.i18n.get("icon_download"))
-    
+        if self._drag_active:
+            return
+        self._drag_active = True
+        self.drop_area.configure(border_color=self._border_hover)
+        self.drop_icon_label.configure(text=self._icon_download)
+
     def _on_drag_leave(self, event):
         """Обробник виходу курсора."""
-        self.drop_area.configure(border_color=self.theme_manager.get_color("drop_zone_border"))
-        self.drop_icon_label.configure(text=self.i18n.get("icon_clip"))
+        if not self._drag_active:
+            return
+        self._drag_active = False
+        self.drop_area.configure(border_color=self._border_normal)
+        self.drop_icon_label.configure(text=self._icon_clip)
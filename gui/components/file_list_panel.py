@@ -5,15 +5,27 @@ File List Panel - Панель зі списком файлів
 Компонент для відображення та управління списком файлів.
 """
 
+import collections
 import customtkinter as ctk
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Callable, Dict, Optional
+from typing import Callable, Deque, Dict, Optional
 from converter.file_handler import FileHandler
+from gui.components._fonts import font
+from utils.logger import Logger
+
+# Спільний пул для stat-запитів розмірів файлів: синхронний stat у
+# Tk-потоці помітно гальмує на мережевих дисках
+_STAT_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="filestat")
 
 
 class FileListPanel(ctk.CTkFrame):
     """Панель зі списком файлів для конвертації."""
-    
+
+    # Кількість рядків, що матеріалізуються за один кадр
+    _RENDER_BATCH = 40
+
     def __init__(
         self,
         parent,
@@ -23,7 +35,7 @@ class FileListPanel(ctk.CTkFrame):
         **kwargs
     ):
         """Ініціалізація панелі списку файлів.
-        
+
         Args:
             parent: Батьківський віджет
             on_remove_file: Callback для видалення файлу
@@ -31,27 +43,49 @@ class FileListPanel(ctk.CTkFrame):
             i18n: Система локалізації
         """
         super().__init__(parent, **kwargs)
-        
+
         self.on_remove_file = on_remove_file
         self.theme_manager = theme_manager
         self.i18n = i18n
-        
-        self.file_widgets: List[ctk.CTkFrame] = []
-        self.file_progress_bars: Dict[int, ctk.CTkProgressBar] = {}
-        
+
+        # Глибина вкладених bulk-оновлень (freeze/thaw)
+        self._bulk_depth = 0
+        # Єдиний запис на файл (шлях, статус, frame, label-и, прогрес)
+        # за індексом: видалення та оновлення - O(1) по одному словнику
+        # замість трьох паралельних колекцій з ризиком розсинхрону.
+        # Tk-віджети матеріалізуються порціями з черги, щоб великий drop
+        # не створював тисячі віджетів за один кадр
+        self._rows: Dict[int, Dict] = {}
+        self._pending_rows: Deque[Dict] = collections.deque()
+        self._render_after = None
+        # Відкладений старт анімації прогрес барів: токени after за
+        # індексом файлу
+        self._anim_after: Dict[int, object] = {}
+
         self._create_ui()
-    
+
+        # Шрифти рядків створюються один раз: кожен CTkFont - це окремий
+        # Tk ресурс, а add_file викликається на кожен файл
+        self._font_icon = font(20)
+        self._font_name = font(13)
+        self._font_small = font(11)
+
+        # Константні рядки локалізації рядка: шукаються один раз, а не
+        # на кожен матеріалізований файл
+        self._s_icon_document = i18n.get("icon_document")
+        self._s_file_waiting = i18n.get("file_waiting")
+
     def _create_ui(self):
         """Створення UI елементів."""
         # Заголовок
         header = ctk.CTkLabel(
             self,
             text="📋 Список файлів",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=font(14, "bold"),
             anchor="w"
         )
         header.grid(row=0, column=0, sticky="w", padx=10, pady=(10, 5))
-        
+
         # Scrollable контейнер для файлів
         self.files_scroll = ctk.CTkScrollableFrame(
             self,
@@ -60,17 +94,80 @@ class FileListPanel(ctk.CTkFrame):
         )
         self.files_scroll.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
         self.files_scroll.grid_columnconfigure(0, weight=1)
-        
+
         self.grid_rowconfigure(1, weight=1)
         self.grid_columnconfigure(0, weight=1)
-    
+
+    def begin_bulk_update(self):
+        """Призупинити перерахунок геометрії на час масового додавання.
+
+        Кожен add_file викликає reflow всього scrollable контейнера -
+        O(N) на файл. Тимчасове зняття контейнера з grid відкладає
+        геометрію до end_bulk_update, де вона рахується один раз.
+        """
+        self._bulk_depth += 1
+        if self._bulk_depth == 1:
+            self.files_scroll.grid_remove()
+
+    def end_bulk_update(self):
+        """Завершити масове додавання та перерахувати геометрію один раз."""
+        if self._bulk_depth == 0:
+            return
+        self._bulk_depth -= 1
+        if self._bulk_depth == 0:
+            self.files_scroll.grid()
+            self._schedule_render()
+            self.update_idletasks()
+
     def add_file(self, file_path: Path, file_index: int):
         """Додати файл до списку.
-        
+
+        Рядок спершу потрапляє у дані; віджети створюються одразу лише
+        поза bulk-режимом, інакше - порціями після end_bulk_update.
+
         Args:
             file_path: Шлях до файлу
             file_index: Індекс файлу в списку
         """
+        row = {
+            'path': file_path,
+            'index': file_index,
+            'status': None,
+            'frame': None,
+            'status_label': None,
+            'progress': None,
+            'open_btn': None
+        }
+        self._rows[file_index] = row
+        if self._bulk_depth == 0:
+            self._materialize_row(row)
+        else:
+            self._pending_rows.append(row)
+
+    def _schedule_render(self):
+        """Запланувати матеріалізацію наступної порції рядків."""
+        if self._render_after is None and self._pending_rows:
+            self._render_after = self.after(16, self._render_batch)
+
+    def _render_batch(self):
+        """Створити порцію віджетів та перепланувати решту."""
+        self._render_after = None
+        for _ in range(min(self._RENDER_BATCH, len(self._pending_rows))):
+            row = self._pending_rows.popleft()
+            # Рядок міг бути видалений до матеріалізації
+            if self._rows.get(row['index']) is row:
+                self._materialize_row(row)
+        self._schedule_render()
+
+    def _materialize_row(self, row: Dict):
+        """Створити Tk-віджети для рядка з даних.
+
+        Args:
+            row: Дані рядка з _rows
+        """
+        file_path = row['path']
+        file_index = row['index']
+
         # Контейнер для файлу
         file_frame = ctk.CTkFrame(
             self.files_scroll,
@@ -81,59 +178,52 @@ class FileListPanel(ctk.CTkFrame):
         )
         file_frame.grid(sticky="ew", padx=5, pady=3)
         file_frame.grid_columnconfigure(1, weight=1)
-        
+
         # Іконка файлу
         icon_label = ctk.CTkLabel(
             file_frame,
-            text=self.i18n.get("icon_document"),
-            font=ctk.CTkFont(size=20),
+            text=self._s_icon_document,
+            font=self._font_icon,
             text_color=self.theme_manager.get_color("text_primary"),
             width=40
         )
         icon_label.grid(row=0, column=0, padx=(10, 5), pady=10, rowspan=2)
-        
+
         # Ім'я файлу
         name_label = ctk.CTkLabel(
             file_frame,
             text=file_path.name,
-            font=ctk.CTkFont(size=13),
+            font=self._font_name,
             text_color=self.theme_manager.get_color("text_primary"),
             anchor="w"
         )
         name_label.grid(row=0, column=1, sticky="w", padx=5, pady=(10, 0))
-        
-        # Розмір файлу
-        size_text = FileHandler.get_file_size(file_path)
+
+        # Розмір файлу: спершу заглушка, справжній розмір приходить з
+        # фонового потоку, щоб не робити stat у Tk-потоці
         size_label = ctk.CTkLabel(
             file_frame,
-            text=size_text,
-            font=ctk.CTkFont(size=11),
+            text="…",
+            font=self._font_small,
             text_color=self.theme_manager.get_color("text_secondary"),
             width=80
         )
         size_label.grid(row=0, column=2, padx=5, pady=10, rowspan=2)
-        
+        _STAT_EXECUTOR.submit(self._fetch_size, file_path, size_label)
+
         # Статус
         status_label = ctk.CTkLabel(
             file_frame,
-            text=self.i18n.get("file_waiting"),
-            font=ctk.CTkFont(size=11),
+            text=self._s_file_waiting,
+            font=self._font_small,
             text_color=self.theme_manager.get_color("text_secondary"),
             width=120
         )
         status_label.grid(row=0, column=3, padx=5, pady=10, rowspan=2)
-        
-        # Прогрес бар (спочатку схований)
-        progress_bar = ctk.CTkProgressBar(
-            file_frame,
-            mode="indeterminate",
-            width=100,
-            height=15
-        )
-        progress_bar.grid(row=1, column=1, sticky="ew", padx=5, pady=(0, 10))
-        progress_bar.grid_remove()
-        self.file_progress_bars[file_index] = progress_bar
-        
+
+        # Прогрес бар не створюється наперед: він потрібен лише файлам,
+        # що реально конвертуються (_ensure_progress_bar)
+
         # Кнопка відкриття PDF (спочатку схована)
         open_btn = ctk.CTkButton(
             file_frame,
@@ -142,11 +232,11 @@ class FileListPanel(ctk.CTkFrame):
             height=30,
             fg_color=self.theme_manager.get_color("success"),
             hover_color=self.theme_manager.get_color("success"),
-            command=lambda: self._open_pdf(file_path)
+            command=functools.partial(self._open_pdf, file_path)
         )
         open_btn.grid(row=0, column=4, padx=(5, 5), pady=10, rowspan=2)
         open_btn.grid_remove()  # Спочатку схована
-        
+
         # Кнопка видалення
         delete_btn = ctk.CTkButton(
             file_frame,
@@ -155,75 +245,192 @@ class FileListPanel(ctk.CTkFrame):
             height=30,
             fg_color=self.theme_manager.get_color("error"),
             hover_color=self.theme_manager.get_color("error"),
-            command=lambda: self.on_remove_file(file_path, file_frame, file_index)
+            # partial замість lambda: один спільний code object на всі
+            # рядки, без замикання на три локальні змінні
+            command=functools.partial(self._on_delete_clicked, row)
         )
         delete_btn.grid(row=0, column=5, padx=10, pady=10, rowspan=2)
-        
-        # Зберігаємо посилання на віджет та кнопки
-        self.file_widgets.append(file_frame)
-        file_frame.open_btn = open_btn
-        
-        # Зберігаємо label статусу для подальшого оновлення
-        file_frame.status_label = status_label
-    
+
+        # Всі посилання живуть в одному записі рядка
+        row['frame'] = file_frame
+        row['status_label'] = status_label
+        row['open_btn'] = open_btn
+
+        # Статус, встановлений до матеріалізації рядка
+        if row['status'] is not None:
+            status_label.configure(text=row['status'])
+
+    def _fetch_size(self, file_path: Path, size_label: ctk.CTkLabel):
+        """Обчислити розмір файлу та повернути результат у Tk-потік.
+
+        Args:
+            file_path: Шлях до файлу
+            size_label: Label для відображення розміру
+        """
+        size_text = FileHandler.get_file_size(file_path)
+        self.after(0, self._apply_size, size_label, size_text)
+
+    def _apply_size(self, size_label: ctk.CTkLabel, size_text: str):
+        """Записати розмір у label, якщо рядок ще існує.
+
+        Args:
+            size_label: Label для відображення розміру
+            size_text: Відформатований розмір
+        """
+        if size_label.winfo_exists():
+            size_label.configure(text=size_text)
+
     def clear_all(self):
         """Очистити всі файли зі списку."""
-        for widget in self.file_widgets:
-            widget.destroy()
-        
-        self.file_widgets.clear()
-        self.file_progress_bars.clear()
-    
-    def remove_file(self, widget: ctk.CTkFrame, file_index: int):
+        if self._render_after is not None:
+            self.after_cancel(self._render_after)
+            self._render_after = None
+
+        for row in self._rows.values():
+            if row['frame'] is not None:
+                row['frame'].destroy()
+
+        self._rows.clear()
+        self._pending_rows.clear()
+
+    def _on_delete_clicked(self, row: Dict):
+        """Обробник кнопки видалення рядка.
+
+        Args:
+            row: Дані рядка з _rows
+        """
+        self.on_remove_file(row['path'], row['frame'], row['index'])
+
+    def remove_file(self, widget: Optional[ctk.CTkFrame], file_index: int):
         """Видалити файл зі списку.
-        
+
+        Ключі рядків - позиційні індекси files_list, тому після
+        видалення всі наступні рядки перекейовуються на -1: індекси з
+        enumerate(files_list) у циклі конвертації знову збігаються з
+        рядками, як у базовому списковому варіанті.
+
         Args:
-            widget: Віджет файлу
+            widget: Віджет файлу (може бути None, якщо рядок ще не
+                матеріалізовано)
             file_index: Індекс файлу
         """
-        if widget in self.file_widgets:
-            self.file_widgets.remove(widget)
-        
-        if file_index in self.file_progress_bars:
-            del self.file_progress_bars[file_index]
-        
-        widget.destroy()
-    
+        row = self._rows.pop(file_index, None)
+        frame = row['frame'] if row is not None else None
+        if frame is None:
+            frame = widget
+        if frame is not None:
+            frame.destroy()
+
+        anim_token = self._anim_after.pop(file_index, None)
+        if anim_token is not None:
+            self.after_cancel(anim_token)
+
+        # Зсув індексів рядків після видаленого: row['index']
+        # оновлюється на місці, тож partial-колбеки кнопок і черга
+        # матеріалізації бачать актуальне значення
+        if self._rows:
+            shifted: Dict[int, Dict] = {}
+            for idx, r in self._rows.items():
+                if idx > file_index:
+                    r['index'] = idx - 1
+                    shifted[idx - 1] = r
+                else:
+                    shifted[idx] = r
+            self._rows = shifted
+        if self._anim_after:
+            self._anim_after = {
+                (idx - 1 if idx > file_index else idx): token
+                for idx, token in self._anim_after.items()
+            }
+
+    def _ensure_progress_bar(self, file_index: int) -> Optional[ctk.CTkProgressBar]:
+        """Створити прогрес бар файлу при першій потребі.
+
+        Кожен CTkProgressBar - окремий canvas; для великого списку
+        наперед створені бари коштують пам'яті та часу, хоча потрібні
+        лише файлам, що реально конвертуються.
+
+        Args:
+            file_index: Індекс файлу
+
+        Returns:
+            Прогрес бар або None, якщо рядок ще не матеріалізовано
+        """
+        row = self._rows.get(file_index)
+        if row is None or row['frame'] is None:
+            return None
+        if row['progress'] is not None:
+            return row['progress']
+
+        progress_bar = ctk.CTkProgressBar(
+            row['frame'],
+            mode="indeterminate",
+            width=100,
+            height=15
+        )
+        progress_bar.grid(row=1, column=1, sticky="ew", padx=5, pady=(0, 10))
+        row['progress'] = progress_bar
+        return progress_bar
+
     def show_progress(self, file_index: int):
         """Показати прогрес бар для файлу.
-        
+
+        Анімація запускається з затримкою: для файлів, що конвертуються
+        швидко, її ~20 Гц редрав так і не стартує.
+
         Args:
             file_index: Індекс файлу
         """
-        if file_index in self.file_progress_bars:
-            progress_bar = self.file_progress_bars[file_index]
+        progress_bar = self._ensure_progress_bar(file_index)
+        if progress_bar is not None:
             progress_bar.grid()
-            progress_bar.start()
-    
+            self._anim_after[file_index] = self.after(
+                300, self._start_if_still_pending, file_index
+            )
+
+    def _start_if_still_pending(self, file_index: int):
+        """Запустити анімацію, якщо файл досі конвертується.
+
+        Args:
+            file_index: Індекс файлу
+        """
+        self._anim_after.pop(file_index, None)
+        row = self._rows.get(file_index)
+        if row is not None and row['progress'] is not None:
+            row['progress'].start()
+
     def hide_progress(self, file_index: int):
-        """Сховати прогрес бар файлу.
-        
+        """Сховати та знищити прогрес бар файлу.
+
+        Бар створюється лениво у show_progress, тому після завершення
+        файлу звільняється разом зі своїм canvas.
+
         Args:
             file_index: Індекс файлу
         """
-        if file_index in self.file_progress_bars:
-            progress_bar = self.file_progress_bars[file_index]
+        anim_token = self._anim_after.pop(file_index, None)
+        if anim_token is not None:
+            self.after_cancel(anim_token)
+        row = self._rows.get(file_index)
+        if row is not None and row['progress'] is not None:
+            progress_bar = row['progress']
+            row['progress'] = None
             progress_bar.stop()
-            progress_bar.grid_remove()
-    
+            progress_bar.destroy()
+
     def _open_pdf(self, file_path: Path) -> None:
         """Відкрити PDF файл.
-        
+
         Args:
             file_path: Шлях до вихідного Word файлу
         """
         try:
             import os
             import subprocess
-            
+
             # Шлях до PDF (замінюємо розширення)
             pdf_path = file_path.with_suffix('.pdf')
-            
+
             if pdf_path.exists():
                 # Відкриття PDF за замовчуванням
                 if os.name == 'nt':  # Windows
@@ -231,33 +438,39 @@ class FileListPanel(ctk.CTkFrame):
                 else:  # Linux/Mac
                     subprocess.run(['xdg-open', str(pdf_path)])
             else:
-                print(f"PDF файл не знайдено: {pdf_path}")
+                Logger().warning("PDF файл не знайдено: %s", pdf_path)
         except Exception as e:
-            print(f"Помилка відкриття PDF: {e}")
-    
+            Logger().error(f"Помилка відкриття PDF: {e}")
+
     def show_open_button(self, file_index: int) -> None:
         """Показати кнопку відкриття PDF.
-        
+
         Args:
             file_index: Індекс файлу
         """
-        if file_index < len(self.file_widgets):
-            widget = self.file_widgets[file_index]
-            if hasattr(widget, 'open_btn'):
-                widget.open_btn.grid()
-    
+        row = self._rows.get(file_index)
+        if row is not None and row['open_btn'] is not None:
+            row['open_btn'].grid()
+
     def update_status(self, file_index: int, status: str):
         """Оновити статус файлу.
-        
+
         Args:
             file_index: Індекс файлу
             status: Новий статус
         """
-        if file_index < len(self.file_widgets):
-            widget = self.file_widgets[file_index]
-            if hasattr(widget, 'status_label'):
-                widget.status_label.configure(text=status)
-    
+        # Статус завжди пишеться у дані; віджет оновлюється лише якщо
+        # рядок вже матеріалізовано. Однаковий статус не
+        # перенадсилається у Tk
+        row = self._rows.get(file_index)
+        if row is None:
+            return
+        if row['status'] == status:
+            return
+        row['status'] = status
+        if row['status_label'] is not None:
+            row['status_label'].configure(text=status)
+
     def get_file_count(self) -> int:
         """Отримати кількість файлів у списку."""
-        return len(self.file_widgets)
+        return len(self._rows)
@@ -7,13 +7,26 @@ Log Viewer Panel - Панель для перегляду логів
 
 import customtkinter as ctk
 from typing import Optional
-import threading
-import queue
+import collections
+import time
+
+from gui.components._fonts import font
 
 
 class LogViewerPanel(ctk.CTkToplevel):
     """Вікно для перегляду логів в реальному часі."""
-    
+
+    # Іконки для рівнів логування
+    _LEVEL_ICONS = {
+        "INFO": "ℹ️",
+        "WARNING": "⚠️",
+        "ERROR": "❌",
+        "SUCCESS": "✅"
+    }
+    # Обмеження буфера: при перевищенні видаляються найстаріші рядки
+    _MAX_LINES = 5000
+    _TRIM_LINES = 1000
+
     def __init__(self, parent, theme_manager):
         """Ініціалізація панелі логів.
         
@@ -24,28 +37,35 @@ class LogViewerPanel(ctk.CTkToplevel):
         super().__init__(parent)
         
         self.theme_manager = theme_manager
-        self.log_queue = queue.Queue()
+        # deque замість queue.Queue: append/popleft атомарні під GIL,
+        # тож для пари "потік конвертера -> Tk-таймер" блокування зайве
+        self.log_queue = collections.deque()
         self.is_running = True
+        # Кеш відформатованої мітки часу: роздільність - секунда, тому
+        # strftime викликається лише при зміні секунди
+        self._ts_cache = (0, "")
         
-        # Налаштування вікна
+        # Налаштування вікна: розмір і позиція одним geometry-запитом,
+        # winfo_screenwidth/height доступні без update_idletasks
         self.title("📋 Логи конвертації")
-        self.geometry("700x500")
+        x = (self.winfo_screenwidth() - 700) // 2
+        y = (self.winfo_screenheight() - 500) // 2
+        self.geometry(f"700x500+{x}+{y}")
         self.minsize(600, 400)
-        
+
         # Встановлення вікна поверх основного
         self.transient(parent)
         self.lift()
         self.focus_force()
-        
-        # Центрування
-        self.update_idletasks()
-        x = (self.winfo_screenwidth() // 2) - (700 // 2)
-        y = (self.winfo_screenheight() // 2) - (500 // 2)
-        self.geometry(f"700x500+{x}+{y}")
-        
+
+
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
-        
-        self._create_ui()
+
+        # Toplevel з'являється одразу; наповнення будується у наступному
+        # idle-проході, щоб відкриття вікна не чекало на створення
+        # кнопок і Textbox. Повідомлення тим часом накопичуються у черзі
+        self._ui_ready = False
+        self.after_idle(self._create_ui)
         self._start_log_updater()
     
     def _create_ui(self):
@@ -57,7 +77,7 @@ class LogViewerPanel(ctk.CTkToplevel):
         title_label = ctk.CTkLabel(
             header_frame,
             text="📋 Логи конвертації",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=font(16, "bold")
         )
         title_label.pack(side="left")
         
@@ -81,10 +101,11 @@ class LogViewerPanel(ctk.CTkToplevel):
         # Текстове поле для логів
         self.log_text = ctk.CTkTextbox(
             self,
-            font=ctk.CTkFont(family="Consolas", size=11),
+            font=font(11, family="Consolas"),
             wrap="word"
         )
         self.log_text.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        self._ui_ready = True
     
     def add_log(self, message: str, level: str = "INFO"):
         """Додати лог повідомлення.
@@ -93,40 +114,52 @@ class LogViewerPanel(ctk.CTkToplevel):
             message: Текст повідомлення
             level: Рівень логування (INFO, WARNING, ERROR)
         """
-        self.log_queue.put((message, level))
+        self.log_queue.append((message, level))
     
     def _start_log_updater(self):
-        """Запуск оновлювача логів."""
-        def update_loop():
-            while self.is_running:
-                try:
-                    message, level = self.log_queue.get(timeout=0.1)
-                    self.after(0, lambda m=message, l=level: self._append_log(m, l))
-                except queue.Empty:
-                    continue
-        
-        self.update_thread = threading.Thread(target=update_loop, daemon=True)
-        self.update_thread.start()
-    
-    def _append_log(self, message: str, level: str):
-        """Додати повідомлення в текстове поле."""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        
-        # Іконки для рівнів
-        icons = {
-            "INFO": "ℹ️",
-            "WARNING": "⚠️",
-            "ERROR": "❌",
-            "SUCCESS": "✅"
-        }
-        icon = icons.get(level, "•")
-        
-        log_line = f"[{timestamp}] {icon} {message}\n"
-        
-        self.log_text.insert("end", log_line)
-        self.log_text.see("end")  # Прокрутка вниз
-    
+        """Запуск періодичного зливу черги логів у Tk-потоці."""
+        # Замість окремого потоку з after(0, ...) на кожен рядок -
+        # один таймер, що вставляє всю накопичену порцію одним insert
+        self._pump_after = self.after(50, self._pump_logs)
+
+    def _pump_logs(self):
+        """Злити всі накопичені повідомлення одним викликом insert."""
+        if not self.is_running:
+            return
+
+        # До готовності UI повідомлення залишаються у черзі
+        if not self._ui_ready:
+            self._pump_after = self.after(50, self._pump_logs)
+            return
+
+        entries = []
+        try:
+            while True:
+                entries.append(self.log_queue.popleft())
+        except IndexError:
+            pass
+
+        if entries:
+            # Одна мітка часу на порцію, з кешем по секундах
+            sec = int(time.time())
+            if sec != self._ts_cache[0]:
+                self._ts_cache = (sec, time.strftime("%H:%M:%S", time.localtime(sec)))
+            timestamp = self._ts_cache[1]
+            icons = self._LEVEL_ICONS
+            text = "".join(
+                f"[{timestamp}] {icons.get(level, '•')} {message}\n"
+                for message, level in entries
+            )
+            self.log_text.insert("end", text)
+            self.log_text.see("end")  # Прокрутка вниз
+
+            # Обрізання найстаріших рядків, щоб Text не розростався
+            line_count = int(self.log_text.index("end-1c").split(".")[0])
+            if line_count > self._MAX_LINES:
+                self.log_text.delete("1.0", f"{self._TRIM_LINES}.end+1c")
+
+        self._pump_after = self.after(50, self._pump_logs)
+
     def _clear_logs(self):
         """Очистити логи."""
         self.log_text.delete("1.0", "end")
@@ -8,6 +8,8 @@ Status Panel - Панель статусу
 import customtkinter as ctk
 from typing import Optional
 
+from gui.components._fonts import font
+
 
 class StatusPanel(ctk.CTkFrame):
     """Панель статусу програми."""
@@ -43,7 +45,7 @@ class StatusPanel(ctk.CTkFrame):
         self.status_label = ctk.CTkLabel(
             status_frame,
             text=self.i18n.get("status_ready"),
-            font=ctk.CTkFont(size=12),
+            font=font(12),
             anchor="w"
         )
         self.status_label.pack(side="left", padx=20, pady=10)
@@ -52,7 +54,7 @@ class StatusPanel(ctk.CTkFrame):
         version_label = ctk.CTkLabel(
             status_frame,
             text=self.i18n.get("app_version"),
-            font=ctk.CTkFont(size=10),
+            font=font(10),
             text_color=self.theme_manager.get_color("text_secondary")
         )
         version_label.pack(side="right", padx=20, pady=10)
@@ -10,9 +10,12 @@ import customtkinter as ctk
 from pathlib import Path
 from tkinterdnd2 import TkinterDnD
 from tkinter import filedialog, messagebox
+import os
+import queue
+import shutil
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import webbrowser
 import uuid
 
@@ -41,6 +44,7 @@ class MainWindow:
     RECOVERY_CHECK_DELAY_MS = 500
     UPDATE_CHECK_DELAY_MS = 1000
     PROGRESS_BAR_HIDE_DELAY_MS = 500
+    UI_PUMP_INTERVAL_MS = 30
     EXECUTOR_SHUTDOWN_TIMEOUT = 5
     
     def __init__(self):
@@ -57,16 +61,31 @@ class MainWindow:
         # Ініціалізація даних
         self.files_list: List[Path] = []
         self.files_dict: Dict[str, Path] = {}  # UUID -> Path mapping
+        # Індекс нормалізованих ключів шляхів (_dedup_key): перевірка
+        # дублікатів за O(1) без syscall-ів на кожен елемент
+        self._files_set: set = set()
         self.output_folder: Optional[Path] = None
         self.is_converting = False
         self.stop_conversion = False
         self.pause_conversion = False  # #24 Пауза конвертації
         self.conversion_thread: Optional[threading.Thread] = None
+        # Черга UI-подій конвертації: воркери лише кладуть кортежі,
+        # один періодичний таймер зливає їх пачкою у Tk-потоці замість
+        # after_idle-виклику на кожну подію
+        self._ui_q: queue.SimpleQueue = queue.SimpleQueue()
+        self._ui_pump_after = None
         self.log_viewer: Optional[LogViewerPanel] = None  # #27 Вікно логів
         self.log_buffer: List[tuple] = []  # Буфер логів (message, level)
+
+        # Статуси файлів, що використовуються на кожен файл пакета:
+        # шукаються один раз, а не в кожному UI-callback
+        self._t_converting = self.i18n.get("file_converting")
+        self._t_completed = self.i18n.get("file_completed")
+        self._t_failed = self.i18n.get("file_failed")
         
         # Перевірка відновлення та оновлень
-        self.root.after(self.RECOVERY_CHECK_DELAY_MS, self._check_recovery)
+        if self.config.get('general.check_recovery', True):
+            self.root.after(self.RECOVERY_CHECK_DELAY_MS, self._check_recovery)
         if self.config.get('general.check_updates', True):
             self.root.after(self.UPDATE_CHECK_DELAY_MS, self._check_updates)
     
@@ -100,9 +119,29 @@ class MainWindow:
         self.logger.info(f"Ініціалізація ThreadPool з {max_workers} worker(s)")
         # Обмежуємо до 4 одночасних конвертацій для уникнення перевантаження
         self.executor = ThreadPoolExecutor(
-            max_workers=min(max_workers, 4), 
-            thread_name_prefix="converter"
+            max_workers=min(max_workers, 4),
+            thread_name_prefix="converter",
+            # Ініціалізація COM у воркері та прив'язка до окремих
+            # фізичних ядер: довгі конвертації менше мігрують між ядрами
+            initializer=self._make_worker_initializer()
+        )
+
+        # .doc йде через спільний STA-екземпляр Word: такий COM-об'єкт
+        # не можна смикати з кількох потоків, тож .doc завдання
+        # серіалізуються на окремому одно-потоковому пулі
+        self._doc_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="worddoc",
+            initializer=self._make_worker_initializer()
+        )
+
+        # Окремий потік для записів recovery-стану: JSON-запис не
+        # повинен ані блокувати конвертацію, ані чекати у черзі за нею
+        self._recovery_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="recovery"
         )
+        self._recovery_future = None
         
         self.logger.log_app_start()
     
@@ -265,24 +304,45 @@ class MainWindow:
     def _handle_files_dropped(self, paths: List[Path]) -> None:
         """Обробка файлів після drop.
         
+        Args:
+            paths: Список шляхів до файлів або директорій
+        """
+        # Класифікація та рекурсивний обхід директорій виконуються у
+        # фоновому потоці: is_dir/scandir - це syscalls, які при великому
+        # drop підвішують Tk-потік. Статус показується одразу, щоб drop
+        # великої папки не виглядав як зависання
+        self.update_status("🔍 Сканування перетягнутих елементів...")
+        self.executor.submit(self._scan_dropped_paths, paths)
+
+    def _scan_dropped_paths(self, paths: List[Path]) -> None:
+        """Знайти Word файли серед перетягнутих шляхів (фоновий потік).
+
         Args:
             paths: Список шляхів до файлів або директорій
         """
         word_files = []
-        directories = []
-        
+
+        # Спершу перевірка суфікса (без syscall): stat робиться лише
+        # для шляхів, які можуть бути директоріями. Обхід директорій
+        # всередині get_word_files_from_directory вже йде через
+        # os.scandir з префетченими атрибутами
         for path in paths:
-            if path.is_dir():
-                directories.append(path)
-            elif FileHandler.is_word_file(path):
+            if FileHandler.is_word_file(path):
                 word_files.append(path)
-        
-        # Пошук у директоріях
-        if directories:
-            for directory in directories:
-                found_files = FileHandler.get_word_files_from_directory(directory, recursive=True)
-                word_files.extend(found_files)
-        
+            elif path.is_dir():
+                word_files.extend(
+                    FileHandler.get_word_files_from_directory(path, recursive=True)
+                )
+
+        # Повернення у Tk-потік для оновлення UI
+        self.root.after(0, self._finish_files_dropped, word_files)
+
+    def _finish_files_dropped(self, word_files: List[Path]) -> None:
+        """Додати знайдені файли до списку (Tk-потік).
+
+        Args:
+            word_files: Знайдені Word файли
+        """
         if word_files:
             self._add_files(word_files)
             self.logger.info(f"Користувач перетягнув {len(word_files)} файл(ів)")
@@ -316,25 +376,59 @@ class MainWindow:
         Args:
             files: Список шляхів до файлів
         """
-        for file_path in files:
-            # Перевірка дублікатів за абсолютним шляхом
-            if self._is_duplicate(file_path):
-                self.logger.info(f"Пропущено дублікат: {file_path.name}")
-                continue
-            
-            if file_path not in self.files_list:
+        # Геометрія списку рахується один раз на пакет, а не на файл
+        self.file_list.begin_bulk_update()
+        try:
+            for file_path in files:
+                # Перевірка дублікатів за абсолютним шляхом
+                if self._is_duplicate(file_path):
+                    self.logger.info(f"Пропущено дублікат: {file_path.name}")
+                    continue
+
                 file_id = str(uuid.uuid4())
                 self.files_list.append(file_path)
                 self.files_dict[file_id] = file_path
+                self._files_set.add(self._dedup_key(file_path))
                 file_index = len(self.files_list) - 1
                 self.file_list.add_file(file_path, file_index)
-                
+
                 # Попередження про великі файли
                 is_large, size_mb = FileHandler.is_large_file(file_path)
                 if is_large:
                     self.update_status(f"⚠️ Великий файл ({size_mb:.1f} MB) - конвертація може зайняти час")
                     self.logger.warning(f"Додано великий файл: {file_path.name} ({size_mb:.1f} MB)")
-    
+        finally:
+            self.file_list.end_bulk_update()
+
+    def _restore_files(self, files_set: set) -> None:
+        """Швидке відновлення списку файлів після перерваної конвертації.
+
+        Файли вже пройшли валідацію перед перерваним запуском, тому
+        повторні stat() і попередження про розмір зайві: дублікати
+        відсікаються за нормалізованими ключами без syscall-ів.
+
+        Args:
+            files_set: Множина шляхів з файлу відновлення
+        """
+        new_files = [
+            p for p in files_set
+            if self._dedup_key(p) not in self._files_set
+        ]
+        if not new_files:
+            return
+
+        self._files_set.update(self._dedup_key(p) for p in new_files)
+        start = len(self.files_list)
+        self.files_list.extend(new_files)
+
+        self.file_list.begin_bulk_update()
+        try:
+            for offset, file_path in enumerate(new_files):
+                self.files_dict[str(uuid.uuid4())] = file_path
+                self.file_list.add_file(file_path, start + offset)
+        finally:
+            self.file_list.end_bulk_update()
+
     def _remove_file(self, file_path: Path, widget, file_index: int) -> None:
         """Видалити файл зі списку.
         
@@ -345,6 +439,7 @@ class MainWindow:
         """
         if file_path in self.files_list:
             self.files_list.remove(file_path)
+            self._files_set.discard(self._dedup_key(file_path))
             # Видалення з словника UUID
             for file_id, path in list(self.files_dict.items()):
                 if path == file_path:
@@ -358,6 +453,7 @@ class MainWindow:
         """Очистити список файлів."""
         self.files_list.clear()
         self.files_dict.clear()
+        self._files_set.clear()
         self.file_list.clear_all()
         self.update_status(self.i18n.get("status_list_cleared"))
         self.logger.info("Список файлів очищено")
@@ -568,6 +664,7 @@ class MainWindow:
         # Запуск конвертації
         self.is_converting = True
         self.stop_conversion = False
+        self._ui_pump_after = self.root.after(self.UI_PUMP_INTERVAL_MS, self._drain_ui_queue)
         self.conversion_thread = threading.Thread(target=self._perform_conversion, daemon=True)
         self.conversion_thread.start()
     
@@ -592,53 +689,61 @@ class MainWindow:
             failed_indices = []
             
             self.logger.log_batch_start(len(self.files_list))
-            
+
+            # Перевірка диску один раз на весь пакет: statvfs на кожен
+            # файл потрібен лише якщо загальна перевірка не пройшла
+            batch_space_ok = False
+            if self.output_folder:
+                batch_space_ok, _ = FileHandler.reserve_disk_space(
+                    self.output_folder, self.files_list
+                )
+
+            # Налаштування читаються один раз на пакет, а не на файл
+            auto_number = self.config.get("conversion.auto_number_files", False)
+            ask_overwrite = self.config.get("conversion.ask_overwrite", True)
+
+            # Передперевірки - незалежні stat/IO виклики, тож
+            # виконуються паралельно на пулі до серійної фази
+            validations = list(self.executor.map(FileHandler.validate_file, self.files_list))
+            estimates = None
+            free_bytes = None
+            if self.output_folder and not batch_space_ok:
+                estimates = list(self.executor.map(FileHandler.estimate_pdf_size, self.files_list))
+                # Вільне місце кешується та зменшується локально; statvfs
+                # повторюється лише періодично
+                try:
+                    free_bytes = shutil.disk_usage(self.output_folder).free
+                except OSError:
+                    free_bytes = None
+
+            # Фаза 1: підготовка (валідація, шляхи, перезапис, диск) -
+            # серійна, бо містить діалоги з користувачем
+            jobs = []
             for i, file_path in enumerate(self.files_list):
                 if self.stop_conversion:
                     self._log_to_viewer("Конвертація зупинена користувачем", "WARNING")
                     break
-                
-                # #24 Чекаємо поки пауза не буде знята
-                if self.pause_conversion:
-                    self.logger.info(f"Пауза активна, очікування...")
-                
-                while self.pause_conversion and not self.stop_conversion:
-                    time.sleep(0.1)  # Зменшено з 0.5 для швидшої реакції
-                
-                if self.stop_conversion:
-                    break
-                
-                # Оновлення заголовка вікна з прогресом
-                progress_percent = int((i / len(self.files_list)) * 100)
-                self.root.title(f"Word to PDF Converter ({progress_percent}%)")
-                
-                # Прогрес (об'єднані оновлення UI)
-                progress = i / len(self.files_list)
-                self.root.after(0, lambda p=progress, idx=i: self._update_file_progress(idx, p, True))
-                
+
                 self._log_to_viewer(f"Обробка файлу: {file_path.name}", "INFO")
-                
-                # Валідація
-                is_valid, error_msg = FileHandler.validate_file(file_path)
-                
+
+                # Валідація (результат попередньо обчислено паралельно)
+                is_valid, error_msg = validations[i]
+
                 if not is_valid:
                     self._log_to_viewer(f"❌ Помилка валідації: {file_path.name} - {error_msg}", "ERROR")
-                    self.root.after(0, lambda idx=i, msg=error_msg: self._update_file_error(idx, msg))
+                    self._ui_q.put((i, "error", error_msg, None))
                     fail_count += 1
                     failed_indices.append(i)
                     continue
-                
-                # Конвертація
-                auto_number = self.config.get("conversion.auto_number_files", False)
+
                 output_path = FileHandler.get_output_path(file_path, self.output_folder, auto_number=auto_number)
-                
+
                 # Перевірка існування файлу (тільки якщо не auto_number)
                 if not auto_number and output_path.exists():
-                    ask_overwrite = self.config.get("conversion.ask_overwrite", True)
                     if ask_overwrite:
                         # Запитати користувача про перезапис (в головному потоці)
                         overwrite_result = [None]  # Список для передачі результату між потоками
-                        
+
                         def ask_user():
                             result = messagebox.askyesno(
                                 "Файл існує",
@@ -646,58 +751,122 @@ class MainWindow:
                                 icon='question'
                             )
                             overwrite_result[0] = result
-                        
+
                         self.root.after(0, ask_user)
-                        
+
                         # Чекаємо на відповідь користувача
                         while overwrite_result[0] is None:
                             time.sleep(0.1)
-                        
+
                         if not overwrite_result[0]:
                             # Користувач відмовився перезаписувати
-                            self.root.after(0, lambda idx=i: self.file_list.update_status(idx, "⏭️ Пропущено"))
-                            self.root.after(0, lambda idx=i: self.file_list.hide_progress(idx))
+                            self._ui_q.put((i, "skipped", None, None))
                             self.logger.info(f"Користувач пропустив файл: {output_path}")
                             fail_count += 1
                             failed_indices.append(i)
                             continue
                         # Якщо користувач погодився - продовжуємо конвертацію
                     # Якщо ask_overwrite=False - перезаписуємо без питань
-                
-                # Перевірка диску
-                if self.output_folder:
-                    estimated_size = FileHandler.estimate_pdf_size(file_path)
-                    has_space, space_msg = FileHandler.check_disk_space(self.output_folder, estimated_size)
-                    
-                    if not has_space:
-                        self.root.after(0, lambda idx=i, msg=space_msg: self.file_list.update_status(idx, f"❌ {msg}"))
-                        self.root.after(0, lambda idx=i: self.file_list.hide_progress(idx))
-                        fail_count += 1
-                        failed_indices.append(i)
-                        continue
-                
-                self.logger.log_conversion_start(str(file_path), str(output_path))
-                self._log_to_viewer(f"Конвертація: {file_path.name} → {output_path.name}", "INFO")
-                success, message = self.converter.convert_to_pdf(file_path, output_path)
-                
+
+                # Перевірка диску (по файлу лише коли пакетна не пройшла)
+                if self.output_folder and not batch_space_ok:
+                    estimated_size = estimates[i]
+
+                    # Повторний запит метаданих диска кожні 20 файлів,
+                    # щоб ловити зовнішні зміни вільного місця
+                    if i > 0 and i % 20 == 0:
+                        try:
+                            free_bytes = shutil.disk_usage(self.output_folder).free
+                        except OSError:
+                            free_bytes = None
+
+                    if free_bytes is not None:
+                        estimated_bytes = int(estimated_size * 1024 * 1024)
+                        if free_bytes < estimated_bytes:
+                            # Канонічне повідомлення формує check_disk_space
+                            _, space_msg = FileHandler.check_disk_space(self.output_folder, estimated_size)
+                            self._ui_q.put((i, "error", space_msg, None))
+                            fail_count += 1
+                            failed_indices.append(i)
+                            continue
+                        free_bytes -= estimated_bytes
+                    else:
+                        has_space, space_msg = FileHandler.check_disk_space(self.output_folder, estimated_size)
+
+                        if not has_space:
+                            self._ui_q.put((i, "error", space_msg, None))
+                            fail_count += 1
+                            failed_indices.append(i)
+                            continue
+
+                jobs.append((i, file_path, output_path))
+
+            # Фаза 2: паралельна конвертація на спільному пулі - файли
+            # незалежні, тож воркери завантажуються повністю
+            total = len(self.files_list) or 1
+            completed = 0
+            # .doc - послідовно на одно-потоковому пулі (STA Word),
+            # решта - на спільному пулі
+            futures = {}
+            for i, fp, op in jobs:
+                pool = (
+                    self._doc_executor
+                    if fp.suffix.lower() == '.doc'
+                    else self.executor
+                )
+                futures[pool.submit(self._convert_job, i, fp, op)] = i
+
+            for future in as_completed(futures):
+                # Скасовані через Stop futures теж потрапляють сюди;
+                # їх result() кинув би CancelledError і зіпсував підсумки
+                if future.cancelled():
+                    continue
+                i, success = future.result()
+                completed += 1
+
+                if self.stop_conversion:
+                    # Скасувати все, що ще не стартувало
+                    for pending in futures:
+                        pending.cancel()
+
+                if success is None:
+                    # Пропущено через зупинку
+                    continue
+
+                # Прогрес за фактично завершеними файлами
+                progress = completed / total
+                self.root.title(f"Word to PDF Converter ({int(progress * 100)}%)")
+                self._ui_q.put((i, "progress", None, progress))
+
                 if success:
-                    self._log_to_viewer(f"✅ Успішно: {file_path.name}", "SUCCESS")
-                    self.root.after(0, lambda idx=i: self._update_file_complete(idx))
                     success_count += 1
                     processed_indices.append(i)
                 else:
-                    self._log_to_viewer(f"❌ Помилка: {file_path.name} - {message}", "ERROR")
-                    self.root.after(0, lambda idx=i: self._update_file_failed(idx))
                     fail_count += 1
                     failed_indices.append(i)
-                
-                # Збереження стану recovery
-                if (i + 1) % 5 == 0:
-                    self.recovery_manager.save_state(self.files_list, self.output_folder, processed_indices, failed_indices)
-        
+
+                # Збереження стану recovery: fire-and-forget у фоновому
+                # потоці (копії списків проти гонок), без повторного
+                # submit поки попередній запис не завершився
+                if completed % 5 == 0 and (
+                    self._recovery_future is None or self._recovery_future.done()
+                ):
+                    self._recovery_future = self._recovery_executor.submit(
+                        self.recovery_manager.save_state,
+                        list(self.files_list),
+                        self.output_folder,
+                        list(processed_indices),
+                        list(failed_indices)
+                    )
+
             # Завершення
             elapsed_time = time.time() - start_time
             self.logger.log_batch_complete(success_count, fail_count, elapsed_time)
+            # Дочекатися хвостового запису recovery, щоб clear_state
+            # не був перекритий відкладеним save_state
+            if self._recovery_future is not None:
+                self._recovery_future.result()
+                self._recovery_future = None
             self.recovery_manager.clear_state()
             
             # Відновлення заголовка вікна
@@ -706,13 +875,49 @@ class MainWindow:
             # Логування результату
             self._log_to_viewer(f"Конвертація завершена: {success_count} успішно, {fail_count} помилок", "SUCCESS" if fail_count == 0 else "WARNING")
             
-            self.root.after(0, lambda: self._finish_conversion(success_count, fail_count, elapsed_time))
+            self.root.after(0, self._finish_conversion, success_count, fail_count, elapsed_time)
         except Exception as e:
             self.logger.error(f"Критична помилка конвертації: {e}")
             self._log_to_viewer(f"Критична помилка: {str(e)}", "ERROR")
             self.root.title("Word to PDF Converter")
-            self.root.after(0, lambda: self._finish_conversion(0, len(self.files_list), 0))
+            self.root.after(0, self._finish_conversion, 0, len(self.files_list), 0)
     
+    def _convert_job(self, idx: int, file_path: Path, output_path: Path):
+        """Конвертація одного файлу (виконується у воркері пулу).
+
+        Args:
+            idx: Індекс файлу в списку
+            file_path: Шлях до вхідного файлу
+            output_path: Шлях до вихідного PDF
+
+        Returns:
+            Кортеж (idx, success); success=None якщо файл пропущено
+            через зупинку
+        """
+        # #24 Чекаємо поки пауза не буде знята
+        while self.pause_conversion and not self.stop_conversion:
+            time.sleep(0.1)
+
+        if self.stop_conversion:
+            return idx, None
+
+        self._ui_q.put((idx, "converting", None, None))
+
+        # str-конвертація шляхів відкладена до моменту запису логу
+        self.logger.log_conversion_start(file_path, output_path)
+        self._log_to_viewer(f"Конвертація: {file_path.name} → {output_path.name}", "INFO")
+        # ignore_cache=True: користувач вже підтвердив перезапис вище
+        success, message = self.converter.convert_to_pdf(file_path, output_path, ignore_cache=True)
+
+        if success:
+            self._log_to_viewer(f"✅ Успішно: {file_path.name}", "SUCCESS")
+            self._ui_q.put((idx, "done", None, None))
+        else:
+            self._log_to_viewer(f"❌ Помилка: {file_path.name} - {message}", "ERROR")
+            self._ui_q.put((idx, "failed", None, None))
+
+        return idx, success
+
     def _finish_conversion(self, success: int, failed: int, elapsed_time: float) -> None:
         """Завершення конвертації.
         
@@ -721,8 +926,20 @@ class MainWindow:
             failed: Кількість невдалих конвертацій
             elapsed_time: Час виконання в секундах
         """
+        # Зупинка таймера зливу та фінальний прохід: останні події
+        # воркерів застосовуються до показу підсумків
+        if self._ui_pump_after is not None:
+            self.root.after_cancel(self._ui_pump_after)
+            self._ui_pump_after = None
+        try:
+            while True:
+                idx, state, msg, progress = self._ui_q.get_nowait()
+                self._apply_ui(idx, state, msg, progress)
+        except queue.Empty:
+            pass
+
         self.control_panel.set_progress(1.0)
-        self.root.after(self.PROGRESS_BAR_HIDE_DELAY_MS, lambda: self.control_panel.hide_progress_bar())
+        self.root.after(self.PROGRESS_BAR_HIDE_DELAY_MS, self.control_panel.hide_progress_bar)
         
         self.is_converting = False
         self.control_panel.set_converting_state(False)
@@ -763,16 +980,73 @@ class MainWindow:
         Returns:
             True якщо файл вже є в списку
         """
-        try:
-            resolved_path = file_path.resolve()
-            for existing_file in self.files_list:
-                if existing_file.resolve() == resolved_path:
-                    return True
-            return False
-        except:
-            # Якщо не вдалося resolve, використовуємо просту перевірку
-            return file_path in self.files_list
+        return self._dedup_key(file_path) in self._files_set
+
+    @staticmethod
+    def _dedup_key(file_path: Path) -> str:
+        """Нормалізований ключ шляху для перевірки дублікатів.
+
+        normcase(abspath()) - чисто рядкова нормалізація без syscall-ів
+        на кожен шлях, на відміну від resolve(), який ходить у файлову
+        систему за symlink-ами і блокує Tk-потік на мережевих дисках.
+
+        Args:
+            file_path: Шлях до файлу
+
+        Returns:
+            Нормалізований рядок шляху
+        """
+        return os.path.normcase(os.path.abspath(os.fspath(file_path)))
     
+    def _make_worker_initializer(self):
+        """Створити initializer потоків пулів конвертації.
+
+        Ініціалізує COM у кожному воркері: Dispatch("Word.Application")
+        вимагає CoInitialize саме в тому потоці, що його викликає, а
+        ледачого імпорту pythoncom у потоці конвертації більше немає.
+        Додатково, де платформа це дозволяє, прив'язує воркер до
+        окремого ядра.
+
+        Returns:
+            Callable для ThreadPoolExecutor або None, якщо жодна
+            ініціалізація не потрібна на цій платформі
+
+        Note:
+            psutil.cpu_affinity діє на весь процес, тому тут
+            використовується os.sched_setaffinity(0, ...) - у потоці
+            вона прив'язує лише цей потік.
+        """
+        try:
+            import pythoncom
+        except ImportError:
+            pythoncom = None
+
+        has_affinity = hasattr(os, 'sched_setaffinity')
+        if pythoncom is None and not has_affinity:
+            return None
+
+        cores = sorted(os.sched_getaffinity(0)) if has_affinity else []
+        lock = threading.Lock()
+        counter = [0]
+
+        def _init_worker():
+            if pythoncom is not None:
+                try:
+                    pythoncom.CoInitialize()
+                except Exception:
+                    pass
+            if has_affinity:
+                with lock:
+                    idx = counter[0]
+                    counter[0] += 1
+                if idx < len(cores):
+                    try:
+                        os.sched_setaffinity(0, {cores[idx]})
+                    except OSError:
+                        pass
+
+        return _init_worker
+
     def _calculate_optimal_workers(self) -> int:
         """Розрахунок оптимальної кількості workers."""
         import os
@@ -783,7 +1057,13 @@ class MainWindow:
             has_psutil = False
         
         try:
-            cpu_count = os.cpu_count() or 4
+            # Фізичні ядра, а не логічні (SMT): два воркери на одному
+            # фізичному ядрі конкурують за кеш та виконавчі блоки
+            cpu_count = None
+            if has_psutil:
+                cpu_count = psutil.cpu_count(logical=False)
+            if not cpu_count:
+                cpu_count = os.cpu_count() or 4
             workers = max(1, cpu_count - 1)
             
             if has_psutil:
@@ -811,9 +1091,9 @@ class MainWindow:
                 result = messagebox.askyesno("🔄 Відновлення конвертації", info, icon='question')
                 
                 if result:
-                    remaining_files = self.recovery_manager.get_remaining_files()
+                    remaining_files = self.recovery_manager.get_remaining_files_set()
                     if remaining_files:
-                        self._add_files(remaining_files)
+                        self._restore_files(remaining_files)
                         self.logger.info(f"✅ Відновлено {len(remaining_files)} файл(ів)")
                 
                 self.recovery_manager.clear_state()
@@ -867,7 +1147,19 @@ class MainWindow:
                 self.executor.shutdown(wait=True, timeout=self.EXECUTOR_SHUTDOWN_TIMEOUT)
             except Exception as e:
                 self.logger.warning(f"Помилка зупинки executor: {e}")
-        
+
+        if hasattr(self, '_doc_executor'):
+            try:
+                self._doc_executor.shutdown(wait=True)
+            except Exception as e:
+                self.logger.warning(f"Помилка зупинки doc executor: {e}")
+
+        if hasattr(self, '_recovery_executor'):
+            try:
+                self._recovery_executor.shutdown(wait=True)
+            except Exception as e:
+                self.logger.warning(f"Помилка зупинки recovery executor: {e}")
+
         # Збереження геометрії
         try:
             geometry_str = self.root.geometry()
@@ -892,21 +1184,68 @@ class MainWindow:
         Args:
             message: Текст повідомлення
         """
+        # Без примусового update_idletasks: Tk сам перемалює статус у
+        # найближчому idle-проході, а примусовий виклик на кожне
+        # повідомлення додає зайвий прохід геометрії
         self.status_panel.update_status(message)
-        self.root.update_idletasks()
     
-    def _update_file_progress(self, idx: int, progress: float, show: bool) -> None:
+    def _apply_ui(self, idx: int, state: str, msg: Optional[str] = None,
+                  progress: Optional[float] = None) -> None:
+        """Застосувати всі оновлення панелей для файлу одним викликом.
+
+        Викликається з _drain_ui_queue: воркери не планують callback-и
+        самі, а лише кладуть кортежі подій у чергу.
+
+        Args:
+            idx: Індекс файлу
+            state: Подія ("converting", "done", "failed", "error",
+                "skipped", "progress")
+            msg: Повідомлення про помилку (для "error")
+            progress: Загальний прогрес (0-1), якщо змінився
+        """
+        if state == "converting":
+            self._update_file_progress(idx, None, True)
+        elif state == "done":
+            self._update_file_complete(idx)
+        elif state == "failed":
+            self._update_file_failed(idx)
+        elif state == "error":
+            self._update_file_error(idx, msg)
+        elif state == "skipped":
+            self.file_list.update_status(idx, "⏭️ Пропущено")
+            self.file_list.hide_progress(idx)
+        if progress is not None:
+            self.control_panel.set_progress(progress)
+
+    def _drain_ui_queue(self) -> None:
+        """Злити накопичені події конвертації одним проходом у Tk-потоці.
+
+        Один таймер на ~30 Гц замість after_idle на кожну подію: під
+        паралельним пакетом це кілька викликів планувальника Tk на
+        секунду незалежно від кількості воркерів.
+        """
+        try:
+            while True:
+                idx, state, msg, progress = self._ui_q.get_nowait()
+                self._apply_ui(idx, state, msg, progress)
+        except queue.Empty:
+            pass
+        self._ui_pump_after = self.root.after(self.UI_PUMP_INTERVAL_MS, self._drain_ui_queue)
+
+    def _update_file_progress(self, idx: int, progress: Optional[float], show: bool) -> None:
         """Оновити прогрес файлу (об'єднана функція).
-        
+
         Args:
             idx: Індекс файлу
-            progress: Прогрес (0-1)
+            progress: Прогрес (0-1) або None, якщо загальний прогрес
+                оновлюється окремо за завершеними файлами
             show: Показати прогрес бар
         """
         if show:
             self.file_list.show_progress(idx)
-        self.file_list.update_status(idx, self.i18n.get("file_converting"))
-        self.control_panel.set_progress(progress)
+        self.file_list.update_status(idx, self._t_converting)
+        if progress is not None:
+            self.control_panel.set_progress(progress)
     
     def _update_file_error(self, idx: int, error_msg: str) -> None:
         """Оновити статус помилки файлу.
@@ -924,7 +1263,7 @@ class MainWindow:
         Args:
             idx: Індекс файлу
         """
-        self.file_list.update_status(idx, self.i18n.get("file_completed"))
+        self.file_list.update_status(idx, self._t_completed)
         self.file_list.hide_progress(idx)
         self.file_list.show_open_button(idx)  # Показати кнопку відкриття PDF
     
@@ -934,7 +1273,7 @@ class MainWindow:
         Args:
             idx: Індекс файлу
         """
-        self.file_list.update_status(idx, self.i18n.get("file_failed"))
+        self.file_list.update_status(idx, self._t_failed)
         self.file_list.hide_progress(idx)
     
     def run(self):
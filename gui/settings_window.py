@@ -44,9 +44,7 @@ class SettingsWindow(ctk.CTkToplevel):
         saved_y = self.config.get("settings_window.y")
         saved_width = self.config.get("settings_window.width", 600)
         saved_height = self.config.get("settings_window.height", 550)
-        
-        self.update_idletasks()
-        
+
         if saved_x is not None and saved_y is not None:
             # Використовуємо збережену позицію та розміри
             self.geometry(f"{saved_width}x{saved_height}+{saved_x}+{saved_y}")
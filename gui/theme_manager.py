@@ -4,6 +4,7 @@
 """
 
 from typing import Dict, Literal
+import functools
 import customtkinter as ctk
 
 
@@ -88,14 +89,19 @@ class ThemeManager:
         self._current_theme = "dark"
         # Встановити appearance mode для CustomTkinter
         ctk.set_appearance_mode("dark")
-    
+        # Скидання мемоізованих кольорів при зміні теми
+        self.get_color.cache_clear()
+
+    @functools.lru_cache(maxsize=128)
     def get_color(self, color_name: str) -> str:
         """
-        Отримує колір для поточної теми.
-        
+        Отримує колір для поточної теми (мемоізовано).
+
+        Кеш скидається у set_theme при перемиканні теми.
+
         Args:
             color_name: Назва кольору
-            
+
         Returns:
             Hex код кольору
         """
@@ -124,7 +130,12 @@ class ThemeManager:
             enter_color = self.get_color("accent_hover")
         if leave_color is None:
             leave_color = self.get_color("accent_primary")
-        
+
+        # Однакові кольори станів - візуальний no-op: не вішаємо
+        # обробники, щоб кожен рух миші не диспетчеризував callback
+        if enter_color == leave_color:
+            return
+
         def on_enter(event):
             try:
                 widget.configure(fg_color=enter_color)
@@ -141,6 +141,85 @@ class TestFileHandler(unittest.TestCase):
         self.assertTrue('(1)' in output_path.stem)
 
 
+class TestDocxIntegrity(unittest.TestCase):
+    """Тести перевірки цілісності DOCX (ручний парсер центральної директорії)"""
+
+    def setUp(self):
+        """Налаштування перед кожним тестом"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Очищення після кожного тесту"""
+        import shutil
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def _make_docx(self, name: str, members, comment: bytes = b'') -> Path:
+        """Створити ZIP-файл з вказаними членами архіву.
+
+        Args:
+            name: Ім'я файлу
+            members: Імена членів архіву
+            comment: Коментар архіву (опціонально)
+
+        Returns:
+            Шлях до створеного файлу
+        """
+        import zipfile
+        docx_path = Path(self.temp_dir) / name
+        with zipfile.ZipFile(docx_path, 'w') as zf:
+            for member in members:
+                zf.writestr(member, '<xml/>')
+            if comment:
+                zf.comment = comment
+        return docx_path
+
+    def test_integrity_valid_docx(self):
+        """Тест валідного DOCX з обома обов'язковими членами"""
+        docx_path = self._make_docx(
+            'valid.docx', ['[Content_Types].xml', 'word/document.xml']
+        )
+
+        is_valid, error = FileHandler.check_file_integrity(docx_path)
+
+        self.assertTrue(is_valid)
+        self.assertEqual(error, "OK")
+
+    def test_integrity_missing_document_xml(self):
+        """Тест DOCX без word/document.xml"""
+        docx_path = self._make_docx(
+            'no_document.docx', ['[Content_Types].xml', 'word/styles.xml']
+        )
+
+        is_valid, error = FileHandler.check_file_integrity(docx_path)
+
+        self.assertFalse(is_valid)
+        self.assertIn('word/document.xml', error)
+
+    def test_integrity_not_a_zip(self):
+        """Тест файлу з розширенням .docx, що не є ZIP архівом"""
+        docx_path = Path(self.temp_dir) / 'fake.docx'
+        docx_path.write_bytes(b'not a zip archive at all')
+
+        is_valid, error = FileHandler.check_file_integrity(docx_path)
+
+        self.assertFalse(is_valid)
+        self.assertIn('пошкоджений', error.lower())
+
+    def test_integrity_zip_with_comment(self):
+        """Тест DOCX з коментарем архіву (зсуває End-of-Central-Directory)"""
+        docx_path = self._make_docx(
+            'commented.docx',
+            ['[Content_Types].xml', 'word/document.xml'],
+            comment=b'archive comment ' * 8
+        )
+
+        is_valid, error = FileHandler.check_file_integrity(docx_path)
+
+        self.assertTrue(is_valid)
+        self.assertEqual(error, "OK")
+
+
 class TestCompressionLevels(unittest.TestCase):
     """Тести для різних рівнів стиснення"""
     
@@ -6,6 +6,7 @@ Localization System - Система локалізації
 """
 
 from typing import Dict, Any
+import functools
 
 
 class Localization:
@@ -151,23 +152,37 @@ class Localization:
                 "error_file_too_large": "Файл занадто великий",
         }
     
+    @functools.lru_cache(maxsize=256)
+    def _lookup(self, key: str) -> str:
+        """Мемоізований пошук тексту за ключем.
+
+        Кеш слід скидати через _lookup.cache_clear() при зміні мови.
+
+        Args:
+            key: Ключ тексту
+
+        Returns:
+            Текст інтерфейсу або ключ, якщо текст відсутній
+        """
+        return self._translations.get(key, key)
+
     def get(self, key: str, **kwargs) -> str:
         """Отримання тексту за ключем.
-        
+
         Args:
             key: Ключ тексту
             **kwargs: Параметри для форматування рядка
-            
+
         Returns:
             Текст інтерфейсу
         """
-        translation = self._translations.get(key, key)
-        
+        translation = self._lookup(key)
+
         # Форматування, якщо є параметри
         if kwargs:
             try:
                 return translation.format(**kwargs)
             except KeyError:
                 return translation
-        
+
         return translation
@@ -102,84 +102,90 @@ class Logger:
             backup_count=backup_count or 5
         )
     
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         """Лог на рівні DEBUG.
-        
+
         Args:
-            message: Повідомлення для логування
+            message: Повідомлення для логування (%-шаблон при наявності args)
+            *args: Аргументи для лінивого форматування
         """
         if self._logger:
-            self._logger.debug(message)
-    
-    def info(self, message: str) -> None:
+            self._logger.debug(message, *args)
+
+    def info(self, message: str, *args) -> None:
         """Лог на рівні INFO.
-        
+
         Args:
-            message: Повідомлення для логування
+            message: Повідомлення для логування (%-шаблон при наявності args)
+            *args: Аргументи для лінивого форматування
         """
         if self._logger:
-            self._logger.info(message)
-    
-    def warning(self, message: str) -> None:
+            self._logger.info(message, *args)
+
+    def warning(self, message: str, *args) -> None:
         """Лог на рівні WARNING.
-        
+
         Args:
-            message: Повідомлення для логування
+            message: Повідомлення для логування (%-шаблон при наявності args)
+            *args: Аргументи для лінивого форматування
         """
         if self._logger:
-            self._logger.warning(message)
-    
-    def error(self, message: str, exc_info: bool = False) -> None:
+            self._logger.warning(message, *args)
+
+    def error(self, message: str, *args, exc_info: bool = False) -> None:
         """
         Лог на рівні ERROR.
-        
+
         Args:
-            message: Повідомлення про помилку
+            message: Повідомлення про помилку (%-шаблон при наявності args)
+            *args: Аргументи для лінивого форматування
             exc_info: Включити traceback exception
         """
         if self._logger:
-            self._logger.error(message, exc_info=exc_info)
-    
-    def critical(self, message: str, exc_info: bool = False) -> None:
+            self._logger.error(message, *args, exc_info=exc_info)
+
+    def critical(self, message: str, *args, exc_info: bool = False) -> None:
         """
         Лог на рівні CRITICAL.
-        
+
         Args:
-            message: Критичне повідомлення
+            message: Критичне повідомлення (%-шаблон при наявності args)
+            *args: Аргументи для лінивого форматування
             exc_info: Включити traceback exception
         """
         if self._logger:
-            self._logger.critical(message, exc_info=exc_info)
-    
-    def log_conversion_start(self, file_path: str, output_path: str) -> None:
+            self._logger.critical(message, *args, exc_info=exc_info)
+
+    def log_conversion_start(self, file_path, output_path) -> None:
         """Лог початку конвертації файлу.
-        
+
         Args:
             file_path: Шлях до вхідного файлу
             output_path: Шлях до вихідного файлу
         """
-        self.info(f"Початок конвертації: {file_path} → {output_path}")
-    
-    def log_conversion_success(self, file_path: str, duration: float) -> None:
+        # %-шаблон: str(Path) обчислюється лише якщо INFO увімкнено
+        self.info("Початок конвертації: %s → %s", file_path, output_path)
+
+    def log_conversion_success(self, file_path, duration: float) -> None:
         """Лог успішної конвертації.
-        
+
         Args:
             file_path: Шлях до файлу
             duration: Тривалість в секундах
         """
-        self.info(f"✅ Успішно конвертовано: {file_path} (за {duration:.2f}s)")
-    
-    def log_conversion_error(self, file_path: str, error: str) -> None:
+        self.info("✅ Успішно конвертовано: %s (за %.2fs)", file_path, duration)
+
+    def log_conversion_error(self, file_path, error: str) -> None:
         """Лог помилки конвертації."""
-        self.error(f"❌ Помилка конвертації {file_path}: {error}")
-    
+        self.error("❌ Помилка конвертації %s: %s", file_path, error)
+
     def log_batch_start(self, file_count: int):
         """Лог початку пакетної конвертації."""
-        self.info(f"🚀 Початок пакетної конвертації: {file_count} файл(ів)")
-    
+        self.info("🚀 Початок пакетної конвертації: %d файл(ів)", file_count)
+
     def log_batch_complete(self, success: int, failed: int, duration: float):
         """Лог завершення пакетної конвертації."""
-        self.info(f"✅ Пакетну конвертацію завершено: {success} успішно, {failed} помилок (за {duration:.2f}s)")
+        self.info("✅ Пакетну конвертацію завершено: %d успішно, %d помилок (за %.2fs)", success, failed, duration)
     
     def log_app_start(self):
         """Лог запуску програми."""
@@ -163,6 +163,21 @@ class RecoveryManager:
             self.logger.error(f"Помилка отримання файлів: {e}")
             return None
 
+    def get_remaining_files_set(self) -> Optional[set]:
+        """Отримання необроблених файлів як множини.
+
+        Варіант get_remaining_files для швидкого відновлення: порядок
+        повторного запуску не важливий, а множина дозволяє відсікати
+        дублікати однією операцією різниці замість циклу по списку.
+
+        Returns:
+            Множина шляхів або None
+        """
+        remaining = self.get_remaining_files()
+        if remaining is None:
+            return None
+        return set(remaining)
+
 
 # Тестування
 if __name__ == "__main__":